@@ -4,6 +4,7 @@ import {
   uploadAudio,
   startTranscription,
   getJob,
+  subscribeJob,
   getTranscript,
   listTranscripts,
   type TranscriptItem,
@@ -128,44 +129,60 @@ export default function App() {
     } catch (e: any) { alert(e?.message || "Failed to start transcription"); }
   }
 
-  // Poll job
+  // Follow job: pushed over SSE, polling getJob if the stream isn't available
   useEffect(() => {
     if (!jobId) return;
     let cancelled = false;
+    let pollTimer: ReturnType<typeof setTimeout> | null = null;
     const jid = jobId;
 
+    // apply one job update; true once the job is finished
+    async function handleJob(j: JobGetResponse): Promise<boolean> {
+      setJob(j);
+
+      if (j.status === "done" && j.result_ref) {
+        const tr = await getTranscript(j.result_ref);
+        if (!cancelled) {
+          setTranscriptText(tr.text || "");
+          setActiveTranscriptId(j.result_ref);
+
+          setTitle(tr.title || "");
+          setNotes(tr.notes || "");
+          lastSavedNotesRef.current = tr.notes || "";
+          setNotesSaving("idle");
+
+          const data = await listTranscripts();
+          if (!cancelled) setHistory(data.items);
+        }
+        return true;
+      }
+      if (j.status === "error") { alert(`Job error: ${j.error || "unknown"}`); return true; }
+      return j.status === "done";
+    }
+
     async function poll(id: string) {
       try {
         const j = await getJob(id);
         if (cancelled) return;
-        setJob(j);
-
-        if (j.status === "done" && j.result_ref) {
-          const tr = await getTranscript(j.result_ref);
-          if (!cancelled) {
-            setTranscriptText(tr.text || "");
-            setActiveTranscriptId(j.result_ref);
-
-            setTitle(tr.title || "");
-            setNotes(tr.notes || "");
-            lastSavedNotesRef.current = tr.notes || "";
-            setNotesSaving("idle");
-
-            const data = await listTranscripts();
-            if (!cancelled) setHistory(data.items);
-          }
-          return;
-        }
-        if (j.status === "error") { alert(`Job error: ${j.error || "unknown"}`); return; }
-        setTimeout(() => poll(id), 1200);
+        if (await handleJob(j)) return;
+        if (!cancelled) pollTimer = setTimeout(() => poll(id), 1200);
       } catch (e) {
         console.error(e);
-        setTimeout(() => poll(id), 1800);
+        if (!cancelled) pollTimer = setTimeout(() => poll(id), 1800);
       }
     }
 
-    poll(jid);
-    return () => { cancelled = true; };
+    const unsubscribe = subscribeJob(
+      jid,
+      (j) => { if (!cancelled) handleJob(j).catch((e) => console.error(e)); },
+      () => { if (!cancelled) poll(jid); },
+    );
+
+    return () => {
+      cancelled = true;
+      unsubscribe();
+      if (pollTimer) clearTimeout(pollTimer);
+    };
   }, [jobId]);
 
   async function openTranscript(tid: string) {
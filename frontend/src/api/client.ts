@@ -133,6 +133,40 @@ export async function getJob(job_id: string): Promise<JobGetResponse> {
   return res.json();
 }
 
+/**
+ * Subscribe to job updates over server-sent events (GET /api/jobs/{id}/stream).
+ * onUpdate gets every change; the stream is closed after "done"/"error".
+ * onError fires once if the stream can't be used (no EventSource, or the
+ * connection drops before the job finished) so the caller can fall back to
+ * polling getJob. Returns an unsubscribe function.
+ */
+export function subscribeJob(
+  job_id: string,
+  onUpdate: (job: JobGetResponse) => void,
+  onError: () => void
+): () => void {
+  if (typeof EventSource === "undefined") {
+    onError();
+    return () => {};
+  }
+  const es = new EventSource(`${API_BASE}/api/jobs/${job_id}/stream`);
+  let closed = false;
+  const close = () => { closed = true; es.close(); };
+
+  es.onmessage = (ev) => {
+    let j: JobGetResponse;
+    try { j = JSON.parse(ev.data); } catch { return; }
+    if (j.status === "done" || j.status === "error") close();
+    onUpdate(j);
+  };
+  es.onerror = () => {
+    if (closed) return;
+    close(); // don't let EventSource auto-reconnect; the caller polls instead
+    onError();
+  };
+  return close;
+}
+
 export async function getTranscript(transcript_id: string): Promise<TranscriptGetResponse> {
   const res = await fetch(`${API_BASE}/api/transcripts/${transcript_id}?include_text=true`);
   if (!res.ok) throw new Error(`Transcript fetch failed: ${res.status}`);
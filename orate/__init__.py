@@ -0,0 +1,2 @@
+# set the OpenMP thread budget before anything imports numpy/faster_whisper
+from orate.services import threads as _threads  # noqa: F401
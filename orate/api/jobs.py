@@ -1,17 +1,35 @@
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException
+from contextlib import AsyncExitStack
+from typing import Optional
+import time
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from orate.api.responses import model_json_response
 from orate.db import crud
+from orate.services import cache, events
 from orate.schemas.jobs import JobGetResponse
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
-@router.get("/{job_id}", response_model=JobGetResponse)
-def get_job(job_id: str):
+# SSE keep-alive: re-check the job at least this often even without a notification
+# (covers writers in another process when Redis isn't configured)
+STREAM_KEEPALIVE_S = 15.0
+# re-read interval when the worker's writes can't notify us (events.CROSS_PROCESS)
+STREAM_UNNOTIFIED_RECHECK_S = 1.0
+
+
+def _job_response(job_id: str) -> Optional[JobGetResponse]:
+  key = cache.job_key(job_id)
+  hit = cache.get_json(key)
+  if hit is not None:
+    return JobGetResponse(**hit)
+
   job = crud.get_job(job_id)
   if not job:
-    raise HTTPException(status_code=404, detail="job not found")
+    return None
   status_val = job.status.value if hasattr(job.status, "value") else str(job.status)
-  return JobGetResponse(
+  resp = JobGetResponse(
       job_id=job.id,
       status=status_val,
       progress=float(job.progress or 0.0),
@@ -20,6 +38,59 @@ def get_job(job_id: str):
       result_ref=job.result_ref,
       error=job.error,
   )
+  cache.set_json(key, resp.model_dump(), cache.JOB_TTL_S)
+  return resp
+
+
+@router.get("/{job_id}", response_model=JobGetResponse)
+def get_job(job_id: str):
+  resp = _job_response(job_id)
+  if resp is None:
+    raise HTTPException(status_code=404, detail="job not found")
+  return model_json_response(resp)  # polled ~1/s per client
+
+
+# Push progress over server-sent events instead of having the UI poll get_job
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str, request: Request):
+  # subscribe before the first read, so a change in between isn't missed
+  stack = AsyncExitStack()
+  sub = await stack.enter_async_context(events.subscribe(job_id))
+  try:
+    first = await run_in_threadpool(_job_response, job_id)
+  except BaseException:
+    await stack.aclose()
+    raise
+  if first is None:
+    await stack.aclose()
+    raise HTTPException(status_code=404, detail="job not found")
+
+  wait_s = STREAM_KEEPALIVE_S if events.CROSS_PROCESS else STREAM_UNNOTIFIED_RECHECK_S
+
+  async def _events():
+    resp: Optional[JobGetResponse] = first
+    last_data = None
+    last_sent = 0.0
+    async with stack:
+      while resp is not None:
+        data = resp.model_dump_json()
+        now = time.monotonic()
+        if data != last_data:
+          yield f"data: {data}\n\n"
+          last_data, last_sent = data, now
+        elif now - last_sent >= STREAM_KEEPALIVE_S:
+          yield ": keep-alive\n\n"
+          last_sent = now
+        if resp.status in ("done", "error") or await request.is_disconnected():
+          return
+        await sub.wait(wait_s)
+        resp = await run_in_threadpool(_job_response, job_id)
+
+  return StreamingResponse(
+      _events(),
+      media_type="text/event-stream",
+      headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
 
 # NEW: delete job
 @router.delete("/{job_id}", status_code=204)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pathlib import Path
-from datetime import timezone
+import hashlib
+import os
 
+from orate.api.responses import model_json_response
 from orate.services import storage, audio
-from orate.db.session import init_db
 from orate.db import crud
 from orate.schemas.recordings import (
     RecordingCreateResponse,
@@ -14,11 +16,21 @@ from orate.schemas.recordings import (
 
 router = APIRouter(prefix="/api/recordings", tags=["recordings"])
 
+# 4 MiB reads amortize the per-chunk threadpool hop + syscall
+UPLOAD_CHUNK_SIZE = 4 << 20
+
+
+def _write_chunk(fd: int, h, chunk: bytes) -> None:
+    # raw os.write: no BufferedWriter copy; loop in case of a short write
+    view = memoryview(chunk)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+    h.update(chunk)
+
 
 @router.post("", response_model=RecordingCreateResponse)
 async def create_recording(file: UploadFile = File(...)):
-    init_db()
-
     filename = file.filename or "audio.mp3"
     ext = Path(filename).suffix or ".mp3"
     # ✅ Added ".webm" here
@@ -29,21 +41,27 @@ async def create_recording(file: UploadFile = File(...)):
     dst = storage.original_path(rec_id, ext)
     storage.ensure_dir(dst.parent)
 
+    # hash while streaming so the file is traversed once (no re-read for sha256)
+    h = hashlib.sha256()
     try:
-        with dst.open("wb") as out:
+        fd = os.open(str(dst), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
             while True:
-                chunk = await file.read(1024 * 1024)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
                 if not chunk:
                     break
-                out.write(chunk)
+                # offload the blocking write so concurrent uploads don't stall the loop
+                await run_in_threadpool(_write_chunk, fd, h, chunk)
+        finally:
+            os.close(fd)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save upload: {e}")
 
     try:
-        duration = audio.probe_duration(dst)
+        duration = await run_in_threadpool(audio.probe_duration, dst)
     except Exception:
         duration = None
-    sha = storage.sha256_file(dst)
+    sha = h.hexdigest()
 
     crud.create_recording(
         id=rec_id,
@@ -79,10 +97,10 @@ def list_recordings(limit: int = 50):
         items.append(
             RecordingItem(
                 id=r.id,
-                created_at=r.created_at.replace(tzinfo=timezone.utc).isoformat(),
+                created_at=r.created_at_iso,
                 duration_s=r.duration_s,
                 original_ext=r.original_ext,
                 original_path=r.original_path,
             )
         )
-    return RecordingListResponse(items=items)
+    return model_json_response(RecordingListResponse(items=items))
@@ -0,0 +1,76 @@
+# orate/api/responses.py
+from __future__ import annotations
+from typing import Any, Type
+import os
+
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    FileResponse that hands the open file to the server when it supports the
+    ASGI `http.response.zerocopysend` extension, so the kernel sendfile(2)s it
+    without a userspace read/send loop. Otherwise (or for Range/HEAD requests)
+    behaves exactly like FileResponse.
+    """
+
+    # fallback read/send loop: 1 MiB instead of Starlette's 64 KiB, so a
+    # multi-hour SRT goes out in a few iterations
+    chunk_size = 1024 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"].upper() != "GET"
+            or "range" in Headers(scope=scope)
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        with open(self.path, "rb") as f:
+            if self.stat_result is None:
+                self.set_stat_headers(os.fstat(f.fileno()))
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.zerocopysend", "file": f, "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (C encoder). Requires `pip install orjson`."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """
+    JSON for an already-built response model, serialized once by pydantic-core.
+    Returning a Response skips FastAPI re-validating the model against
+    response_model (kept on the route for the OpenAPI schema). For hot polling
+    routes.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def default_json_response_class() -> Type[Response]:
+    """
+    Response class for FastAPI(default_response_class=...). JSONResponse unless
+    ORATE_ORJSON=1 and orjson is installed. Off by default: recent FastAPI
+    serializes response models straight to JSON bytes with pydantic-core, and
+    a custom class sends them through the dump-to-dict path instead. Enable it
+    on older FastAPI releases.
+    """
+    if orjson is not None and os.getenv("ORATE_ORJSON") == "1":
+        return ORJSONResponse
+    return JSONResponse
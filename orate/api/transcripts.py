@@ -1,12 +1,16 @@
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException, Query, Response, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlmodel import Session
 from pathlib import Path
-from datetime import timezone
+from typing import Literal
+import os
 import re
 from urllib.parse import quote
 
+from orate.api.responses import ZeroCopyFileResponse, model_json_response
 from orate.db import crud
+from orate.db.session import get_db
+from orate.services import cache, storage
 from orate.schemas.transcripts import (
     TranscriptGetResponse,
     TranscriptListResponse,
@@ -17,48 +21,81 @@ from orate.schemas.transcripts import (
 
 router = APIRouter(prefix="/api/transcripts", tags=["transcripts"])
 
+# compiled once; _safe_filename runs on every download
+_WS_RE = re.compile(r"\s+")
+_INVALID_RE = re.compile(r"[^A-Za-z0-9 _\.\-]+")
+# deletes every char _INVALID_RE keeps; an empty result means nothing to strip
+_SAFE_CHARS_TABLE = str.maketrans("", "", "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 _.-")
+
+# Optional: when running behind nginx, set this to an `internal` location that
+# aliases the data dir (e.g. "/_protected/") and nginx serves downloads itself.
+ACCEL_REDIRECT_PREFIX = os.getenv("ORATE_ACCEL_REDIRECT_PREFIX")
+
 
 @router.get("", response_model=TranscriptListResponse)
 def list_transcripts(limit: int = Query(50, ge=1, le=200), recording_id: str | None = None):
     rows = crud.list_transcripts_for_recording(recording_id, limit) if recording_id else crud.list_transcripts(limit)
     items: list[TranscriptItem] = []
 
-    for t in rows:
-        preview = ""
-        try:
-            if t.text_path and Path(t.text_path).exists():
-                preview = Path(t.text_path).read_text(encoding="utf-8")[:200].replace("\n", " ")
-        except Exception:
-            preview = ""
+    # previews come from the text_preview column (init_db backfills old rows), so
+    # this stays a sync handler: there is no per-row file I/O to overlap
 
+    for t in rows:
         items.append(
             TranscriptItem(
                 id=t.id,
                 recording_id=t.recording_id,
-                created_at=t.created_at.replace(tzinfo=timezone.utc).isoformat(),
+                created_at=t.created_at_iso,
                 language=t.language,
                 model=t.model,
-                text_preview=preview,
+                text_preview=t.text_preview or "",
                 title=t.title,
             )
         )
 
-    return TranscriptListResponse(items=items)
+    return model_json_response(TranscriptListResponse(items=items))
 
 
 @router.get("/{transcript_id}", response_model=TranscriptGetResponse)
-def get_transcript(transcript_id: str, include_text: bool = True):
+def get_transcript(
+    transcript_id: str,
+    include_text: bool = True,
+    as_file: bool = False,
+    accept: str | None = Header(None),
+):
+    # plain-text clients get the file itself (sendfile) instead of a JSON-escaped copy
+    if as_file or (accept or "").startswith("text/plain"):
+        tr = crud.get_transcript(transcript_id)
+        if not tr:
+            raise HTTPException(status_code=404, detail="transcript not found")
+        path = Path(tr.text_path)
+        try:
+            stat_result = path.stat()
+        except OSError:
+            raise HTTPException(status_code=404, detail="file not found on disk")
+        return ZeroCopyFileResponse(path, media_type="text/plain; charset=utf-8", stat_result=stat_result)
+
+    text_key, meta_key = cache.transcript_keys(transcript_id)
+    key = text_key if include_text else meta_key
+    # with-text bodies are unbounded in size: only cache them in Redis
+    use_cache = cache.SHARED or not include_text
+    hit = cache.get_json(key) if use_cache else None
+    if hit is not None:
+        return TranscriptGetResponse(**hit)
+
     tr = crud.get_transcript(transcript_id)
     if not tr:
         raise HTTPException(status_code=404, detail="transcript not found")
 
     text_content = None
-    if include_text and tr.text_path and Path(tr.text_path).exists():
-        text_content = Path(tr.text_path).read_text(encoding="utf-8")
-
-    created_iso = tr.created_at.replace(tzinfo=timezone.utc).isoformat() if tr.created_at else ""
+    if include_text and tr.text_path:
+        # trust the DB path and just open it: no separate exists() stat
+        try:
+            text_content = storage.read_text(Path(tr.text_path))
+        except FileNotFoundError:
+            text_content = None
 
-    return TranscriptGetResponse(
+    resp = TranscriptGetResponse(
         transcript_id=tr.id,
         recording_id=tr.recording_id,
         text_path=tr.text_path,
@@ -69,18 +106,23 @@ def get_transcript(transcript_id: str, include_text: bool = True):
         device=tr.device,
         compute=tr.compute,
         duration_s=tr.duration_s,
-        created_at=created_iso,
+        created_at=tr.created_at_iso or "",
         text=text_content,
         title=tr.title,
         notes=tr.notes,
     )
+    if use_cache:
+        cache.set_json(key, resp.model_dump(), cache.TRANSCRIPT_TTL_S)
+    return resp
 
 
 def _safe_filename(title: str | None, fallback: str, ext: str) -> str:
     name = (title or "").strip()
-    name = re.sub(r"\s+", " ", name)
-    name = re.sub(r"[^A-Za-z0-9 _\.\-]", "", name)
-    name = name.strip()
+    # fast path: already-clean titles skip both regexes
+    if name.translate(_SAFE_CHARS_TABLE) or "  " in name:
+        name = _WS_RE.sub(" ", name)
+        name = _INVALID_RE.sub("", name)
+        name = name.strip()
     if not name:
         name = fallback
     name = name[:60]
@@ -91,7 +133,7 @@ def _safe_filename(title: str | None, fallback: str, ext: str) -> str:
 
 
 @router.get("/{transcript_id}/download")
-def download_transcript(transcript_id: str, format: str = Query("txt", pattern="^(txt|srt)$")):
+def download_transcript(transcript_id: str, format: Literal["txt", "srt"] = Query("txt")):
     tr = crud.get_transcript(transcript_id)
     if not tr:
         raise HTTPException(status_code=404, detail="transcript not found")
@@ -105,43 +147,47 @@ def download_transcript(transcript_id: str, format: str = Query("txt", pattern="
         path = Path(tr.srt_path)
         ext = ".srt"
 
-    if not path.exists():
+    # one stat: doubles as the existence check and is handed to the response
+    # so it sets Content-Length without stat-ing again
+    try:
+        stat_result = path.stat()
+    except OSError:
         raise HTTPException(status_code=404, detail="file not found on disk")
 
     fname = _safe_filename(tr.title, transcript_id, ext)
     headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(fname)}"}
-    return FileResponse(path, media_type="text/plain; charset=utf-8", headers=headers)
+
+    if ACCEL_REDIRECT_PREFIX:
+        try:
+            rel = path.resolve().relative_to(storage.DATA_ROOT.resolve())
+        except ValueError:
+            rel = None
+        if rel is not None:
+            headers["X-Accel-Redirect"] = ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(rel.as_posix())
+            return Response(media_type="text/plain; charset=utf-8", headers=headers)
+
+    return ZeroCopyFileResponse(
+        path,
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+        stat_result=stat_result,
+    )
 
 
 @router.patch("/{transcript_id}", response_model=TranscriptUpdateResponse)
 def update_transcript(transcript_id: str, payload: TranscriptUpdateRequest):
-    tr = crud.get_transcript(transcript_id)
-    if not tr:
+    updated = crud.update_transcript_fields(transcript_id, title=payload.title, notes=payload.notes)
+    if updated is None:
         raise HTTPException(status_code=404, detail="transcript not found")
 
-    title = payload.title if payload.title is not None else tr.title
-    notes = payload.notes if payload.notes is not None else tr.notes
-
-    # write via crud
-    from orate.db.session import get_session
-    from orate.db.models import Transcript as TranscriptModel
-
-    with get_session() as s:
-        obj = s.get(TranscriptModel, transcript_id)
-        if not obj:
-            raise HTTPException(status_code=404, detail="transcript not found")
-        obj.title = title
-        obj.notes = notes
-        s.add(obj)
-        s.commit()
-
+    title, notes = updated
     return TranscriptUpdateResponse(transcript_id=transcript_id, title=title, notes=notes)
 
 
 @router.delete("/{transcript_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_transcript(transcript_id: str):
+def delete_transcript(transcript_id: str, db: Session = Depends(get_db)):
     """Delete transcript row and its files on disk."""
-    tr = crud.get_transcript(transcript_id)
+    tr = crud.get_transcript(transcript_id, session=db)
     if not tr:
         raise HTTPException(status_code=404, detail="transcript not found")
 
@@ -149,14 +195,12 @@ def delete_transcript(transcript_id: str):
     for p in [tr.text_path, tr.srt_path]:
         if p:
             try:
-                path = Path(p)
-                if path.exists():
-                    path.unlink(missing_ok=True)
+                Path(p).unlink(missing_ok=True)
             except Exception:
                 # ignore filesystem issues; DB delete still proceeds
                 pass
 
-    ok = crud.delete_transcript(transcript_id)
+    ok = crud.delete_transcript(transcript_id, session=db)
     if not ok:
         raise HTTPException(status_code=404, detail="transcript not found")
 
@@ -13,10 +13,10 @@ from pathlib import Path
 import sys
 import time
 import threading
-import queue
+from collections import deque
 
-import sounddevice as sd
-import soundfile as sf
+# sounddevice/soundfile are imported where used: loading them initializes
+# PortAudio/libsndfile, which `--help` and argument errors don't need
 
 
 def parse_args() -> argparse.Namespace:
@@ -36,17 +36,25 @@ def parse_args() -> argparse.Namespace:
 
 
 def list_devices() -> None:
+    import sounddevice as sd
+
     print(sd.query_devices())
 
 
 def interactive_record(out_path: Path, samplerate: int, device: str | None) -> int:
+    import sounddevice as sd
+    import soundfile as sf
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     print("Press Enter to START recording…")
     input()
     print("Recording… Press Enter to STOP.")
 
-    q: queue.Queue = queue.Queue()
+    # RawInputStream hands us a CFFI buffer (no NumPy array per block); it is only
+    # valid during the callback, so take one bytes copy. deque.append/popleft are
+    # atomic in CPython, so no queue lock on the audio thread.
+    blocks: deque[bytes] = deque()
     frames_written = 0
     stop_flag = threading.Event()
 
@@ -54,7 +62,26 @@ def interactive_record(out_path: Path, samplerate: int, device: str | None) -> i
         if status:
             # Print XRuns etc. but keep going
             print(f"[audio] {status}", file=sys.stderr)
-        q.put(indata.copy())
+        blocks.append(bytes(indata))
+
+    # coalesce ~1 s of audio per wav write instead of one write per callback block
+    flush_bytes = samplerate * 2  # mono PCM16
+    pending: list[bytes] = []
+    pending_bytes = 0
+
+    def drain(wav, final: bool = False) -> int:
+        nonlocal pending_bytes
+        while blocks:
+            data = blocks.popleft()
+            pending.append(data)
+            pending_bytes += len(data)
+        if not pending or (pending_bytes < flush_bytes and not final):
+            return 0
+        wav.buffer_write(b"".join(pending), dtype="int16")
+        n = pending_bytes // 2
+        pending.clear()
+        pending_bytes = 0
+        return n
 
     def stopper():
         input()
@@ -63,18 +90,14 @@ def interactive_record(out_path: Path, samplerate: int, device: str | None) -> i
     try:
         with sf.SoundFile(str(out_path), mode="w", samplerate=samplerate, channels=1,
                           subtype="PCM_16", format="WAV") as wav, \
-             sd.InputStream(samplerate=samplerate, channels=1, dtype="int16",
-                            callback=callback, device=device):
+             sd.RawInputStream(samplerate=samplerate, channels=1, dtype="int16",
+                               callback=callback, device=device):
             t0 = time.time()
             thread = threading.Thread(target=stopper, daemon=True)
             thread.start()
-            while not stop_flag.is_set():
-                try:
-                    data = q.get(timeout=0.1)
-                except queue.Empty:
-                    continue
-                wav.write(data)
-                frames_written += len(data)
+            while not stop_flag.wait(0.1):
+                frames_written += drain(wav)
+            frames_written += drain(wav, final=True)
             t1 = time.time()
             elapsed = t1 - t0
     except sd.PortAudioError as e:
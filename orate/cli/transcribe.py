@@ -22,11 +22,11 @@ def _s_to_srt_ts(t: float) -> str:
     # Kept for parity with previous output if needed in the future
     if t is None:
         t = 0.0
-    ms = int(round((t - int(t)) * 1000))
-    s = int(t) % 60
-    m = (int(t) // 60) % 60
-    h = int(t) // 3600
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    # round once on the whole value: rounding ms separately could give ",1000"
+    h, rem = divmod(int(round(t * 1000)), 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
+    return "%02d:%02d:%02d,%03d" % (h, m, s, ms)
 
 
 def parse_args() -> argparse.Namespace:
@@ -37,8 +37,13 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("audio_path", type=Path, help="Path to audio file (MP3 recommended for storage).")
     p.add_argument("--model", default="small", help="tiny, base, small, medium, large-v3, distil-large-v3, turbo, etc.")
     p.add_argument("--device", choices=["cpu", "cuda"], default="cpu", help="CPU or NVIDIA GPU (CUDA).")
-    p.add_argument("--compute", choices=["int8", "float16"], help="Override compute type. Default: cpu→int8, cuda→float16.")
-    p.add_argument("--beam-size", type=int, default=5)
+    p.add_argument("--compute", choices=["auto", "int8", "int8_float16", "float16"],
+                   help="Override compute type. Default: cuda→int8_float16, cpu→int8 (when supported).")
+    p.add_argument("--beam-size", type=int, default=1, help="1 = greedy decoding (default).")
+    p.add_argument("--batch-size", type=int, default=None,
+                   help="Batched inference over VAD chunks (default 8); 1 = sequential decode.")
+    p.add_argument("--cpu-threads", type=int, default=None,
+                   help="CTranslate2 threads (default: physical cores, at most 8).")
     p.add_argument("--language", default=None, help="Force language (e.g., en, es).")
     p.add_argument("--prompt", default=None, help="Initial decoding prompt to bias output.")
     p.add_argument("--word-timestamps", action="store_true", help="Emit word-level timestamps to console.")
@@ -66,6 +71,8 @@ def main() -> int:
         device=args.device,
         compute=args.compute,
         beam_size=args.beam_size,
+        batch_size=args.batch_size,
+        cpu_threads=args.cpu_threads,
         language=args.language,
         prompt=args.prompt,
         word_timestamps=bool(args.word_timestamps),
@@ -73,18 +80,19 @@ def main() -> int:
     )
 
     if args.verbose:
-        comp = args.compute if args.compute else ("float16" if args.device == "cuda" else "int8")
+        comp = opts.resolved().compute
         print(f"[info] model={opts.model} device={opts.device} compute={comp}")
         print(f"[info] input={in_path.resolve()}")
         print(f"[info] out_prefix={out_prefix}")
 
     t0 = time.time()
     try:
-        text, info = transcribe_audio(
+        result = transcribe_audio(
             audio_path=in_path,
             out_prefix=out_prefix,
             opts=opts,
             write_srt=bool(args.srt),
+            keep_text=False,  # segments stream straight to the files
         )
     except FileNotFoundError:
         print(f"[error] Could not open input file (FileNotFoundError). Check the path: {in_path.resolve()}", file=sys.stderr)
@@ -99,9 +107,9 @@ def main() -> int:
 
     # Console summary
     t1 = time.time()
-    lang = getattr(info, "language", None)
-    prob = getattr(info, "language_probability", None)
-    dur = getattr(info, "duration", None)
+    lang = result.language
+    prob = result.language_probability
+    dur = result.duration_sec
 
     if lang is not None and prob is not None:
         print(f"Detected language '{lang}' with probability {prob:.3f}")
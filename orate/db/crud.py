@@ -1,9 +1,15 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Optional, List
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, List, Tuple
+import threading
+import time
 
-from sqlalchemy import desc
-from sqlmodel import select
+from sqlalchemy import Row, desc, func, update
+from sqlmodel import Session, select
+
+from orate.services import cache, events
 
 from .session import get_session
 from .models import Recording, Transcript, Job, JobStatus
@@ -14,6 +20,79 @@ def _now() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
+def iso_utc(dt: datetime) -> str:
+    """ISO string for a naive-UTC datetime from the DB."""
+    return dt.replace(tzinfo=timezone.utc).isoformat()
+
+
+@contextmanager
+def _session(session: Optional[Session]) -> Iterator[Session]:
+    # reuse the caller's (per-request) session if given, else open a short-lived one
+    if session is not None:
+        yield session
+    else:
+        with get_session() as s:
+            yield s
+
+
+class _RowLRU:
+    """
+    Small id -> detached-row LRU for get_recording/get_transcript. Misses are not
+    cached (rows may be created by the worker process). Cached rows are shared:
+    treat them as read-only.
+
+    ttl_s bounds how long a write made by another process can go unseen. Take
+    epoch() before reading the row and pass it to put(): if a pop() happened
+    while the read was in flight, the (possibly stale) row isn't cached.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_s: Optional[float] = None) -> None:
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()  # key -> (row, expires)
+        self._epoch = 0  # bumped by every pop()
+        self._lock = threading.Lock()
+
+    def epoch(self) -> int:
+        with self._lock:
+            return self._epoch
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            row, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return row
+
+    def put(self, key: str, row: Any, epoch: int) -> None:
+        expires = time.monotonic() + self._ttl_s if self._ttl_s is not None else float("inf")
+        with self._lock:
+            if epoch != self._epoch:
+                return  # invalidated mid-read
+            self._data[key] = (row, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._data.pop(key, None)
+
+
+# recordings are never modified after upload; transcripts get title/notes
+# PATCHes, possibly through another API process, so keep those briefly
+_TRANSCRIPT_ROW_TTL_S = 2.0
+
+_recording_rows = _RowLRU()
+_transcript_rows = _RowLRU(ttl_s=_TRANSCRIPT_ROW_TTL_S)
+
+
 # ---------- Recordings ----------
 def create_recording(
     *,
@@ -22,30 +101,52 @@ def create_recording(
     original_path: str,
     duration_s: float,
     sha256: str,
+    session: Optional[Session] = None,
 ) -> Recording:
+    created = _now()
     rec = Recording(
         id=id,
         original_ext=original_ext,
         original_path=original_path,
         duration_s=duration_s,
         sha256=sha256,
-        created_at=_now(),
+        created_at=created,
+        created_at_iso=iso_utc(created),
     )
-    with get_session() as s:
+    with _session(session) as s:
         s.add(rec)
         s.commit()
-        s.refresh(rec)
     return rec
 
 
-def get_recording(rec_id: str) -> Optional[Recording]:
-    with get_session() as s:
-        return s.get(Recording, rec_id)
+def get_recording(rec_id: str, session: Optional[Session] = None) -> Optional[Recording]:
+    # recordings are never modified after upload
+    rec = _recording_rows.get(rec_id)
+    if rec is not None:
+        return rec
+    epoch = _recording_rows.epoch()
+    with _session(session) as s:
+        obj = s.get(Recording, rec_id)
+        if obj is None:
+            return None
+        rec = Recording(**obj.model_dump())
+    _recording_rows.put(rec_id, rec, epoch)
+    return rec
+
+
+# same column-projection approach as _TRANSCRIPT_LIST_COLUMNS below
+_RECORDING_LIST_COLUMNS = (
+    Recording.id,
+    Recording.created_at_iso,
+    Recording.duration_s,
+    Recording.original_ext,
+    Recording.original_path,
+)
 
 
-def list_recordings(limit: int = 50) -> List[Recording]:
-    with get_session() as s:
-        stmt = select(Recording).order_by(desc(Recording.created_at)).limit(limit)
+def list_recordings(limit: int = 50, session: Optional[Session] = None) -> List[Row]:
+    with _session(session) as s:
+        stmt = select(*_RECORDING_LIST_COLUMNS).order_by(desc(Recording.created_at)).limit(limit)
         return list(s.exec(stmt))
 
 
@@ -62,7 +163,11 @@ def create_transcript(
     device: str,
     compute: str,
     duration_s: Optional[float],
+    text_preview: Optional[str] = None,
+    session: Optional[Session] = None,
 ) -> Transcript:
+    """`text_preview` is stored as given: pass storage.text_preview(text) (e.g. TranscribeResult.preview)."""
+    created = _now()
     tr = Transcript(
         id=id,
         recording_id=recording_id,
@@ -74,30 +179,59 @@ def create_transcript(
         device=device,
         compute=compute,
         duration_s=duration_s,
-        created_at=_now(),
+        created_at=created,
+        created_at_iso=iso_utc(created),
+        text_preview=text_preview,
     )
-    with get_session() as s:
+    with _session(session) as s:
         s.add(tr)
         s.commit()
-        s.refresh(tr)
     return tr
 
 
-def get_transcript(tr_id: str) -> Optional[Transcript]:
-    with get_session() as s:
-        return s.get(Transcript, tr_id)
+def get_transcript(tr_id: str, session: Optional[Session] = None) -> Optional[Transcript]:
+    # cached for _TRANSCRIPT_ROW_TTL_S, or until update_transcript_fields/
+    # delete_transcript in this process; see _RowLRU
+    tr = _transcript_rows.get(tr_id)
+    if tr is not None:
+        return tr
+    epoch = _transcript_rows.epoch()
+    with _session(session) as s:
+        obj = s.get(Transcript, tr_id)
+        if obj is None:
+            return None
+        tr = Transcript(**obj.model_dump())
+    _transcript_rows.put(tr_id, tr, epoch)
+    return tr
 
 
-def list_transcripts(limit: int = 50) -> List[Transcript]:
-    with get_session() as s:
-        stmt = select(Transcript).order_by(desc(Transcript.created_at)).limit(limit)
+# List queries are a single SELECT: the models intentionally have no Relationship
+# fields, so nothing is lazy-loaded per row and no selectinload()/joinedload() is
+# needed. If a relationship is ever added, eager-load it here.
+#
+# Listings only fetch the columns TranscriptItem needs (not notes/paths/etc.), and
+# return Rows with attribute access (row.id, row.title, ...) instead of ORM objects.
+_TRANSCRIPT_LIST_COLUMNS = (
+    Transcript.id,
+    Transcript.recording_id,
+    Transcript.created_at_iso,
+    Transcript.language,
+    Transcript.model,
+    Transcript.title,
+    Transcript.text_preview,
+)
+
+
+def list_transcripts(limit: int = 50, session: Optional[Session] = None) -> List[Row]:
+    with _session(session) as s:
+        stmt = select(*_TRANSCRIPT_LIST_COLUMNS).order_by(desc(Transcript.created_at)).limit(limit)
         return list(s.exec(stmt))
 
 
-def list_transcripts_for_recording(rec_id: str, limit: int = 50) -> List[Transcript]:
-    with get_session() as s:
+def list_transcripts_for_recording(rec_id: str, limit: int = 50, session: Optional[Session] = None) -> List[Row]:
+    with _session(session) as s:
         stmt = (
-            select(Transcript)
+            select(*_TRANSCRIPT_LIST_COLUMNS)
             .where(Transcript.recording_id == rec_id)
             .order_by(desc(Transcript.created_at))
             .limit(limit)
@@ -105,24 +239,63 @@ def list_transcripts_for_recording(rec_id: str, limit: int = 50) -> List[Transcr
         return list(s.exec(stmt))
 
 
-def delete_transcript(tr_id: str) -> bool:
+def update_transcript_fields(
+    tr_id: str,
+    *,
+    title: Optional[str] = None,
+    notes: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """
+    Set title/notes in one UPDATE ... RETURNING (None keeps the current value).
+    Returns the stored (title, notes), or None if the transcript doesn't exist.
+    """
+    stmt = (
+        update(Transcript)
+        .where(Transcript.id == tr_id)
+        .values(
+            title=func.coalesce(title, Transcript.title),
+            notes=func.coalesce(notes, Transcript.notes),
+        )
+        .returning(Transcript.title, Transcript.notes)
+    )
+    with _session(session) as s:
+        row = s.exec(stmt).first()
+        s.commit()
+    if row is None:
+        return None
+    _transcript_rows.pop(tr_id)
+    cache.invalidate(*cache.transcript_keys(tr_id))
+    return row[0], row[1]
+
+
+def delete_transcript(tr_id: str, session: Optional[Session] = None) -> bool:
     """Delete the transcript row. Returns True if deleted, False if not found."""
-    with get_session() as s:
+    with _session(session) as s:
         obj = s.get(Transcript, tr_id)
         if not obj:
             return False
         s.delete(obj)
         s.commit()
-        return True
+    _transcript_rows.pop(tr_id)
+    cache.invalidate(*cache.transcript_keys(tr_id))
+    return True
 
 
 # ---------- Jobs ----------
+def _job_changed(job_id: str) -> None:
+    # drop the cached GET response and wake any /stream subscribers
+    cache.invalidate(cache.job_key(job_id))
+    events.notify_job(job_id)
+
+
 def create_job(
     *,
     id: str,
     kind: str,
     payload_json: str,
     status: JobStatus = JobStatus.queued,
+    session: Optional[Session] = None,
 ) -> Job:
     job = Job(
         id=id,
@@ -138,25 +311,31 @@ def create_job(
         created_at=_now(),
         updated_at=_now(),
     )
-    with get_session() as s:
+    with _session(session) as s:
         s.add(job)
         s.commit()
-        s.refresh(job)
     return job
 
 
-def mark_job_running(job_id: str) -> None:
-    with get_session() as s:
-        job = s.get(Job, job_id)
-        if not job:
-            return
-        job.status = JobStatus.running
-        job.stage = "loading_model"
-        job.progress = 0.0
-        job.started_at = _now()
-        job.updated_at = _now()
-        s.add(job)
+def mark_job_running(job_id: str, session: Optional[Session] = None) -> bool:
+    """
+    Claim a queued job: queued -> running in one conditional UPDATE. Returns
+    False if the job is gone or already running/finished (e.g. a redelivered
+    Celery task), so concurrent runs can't both take it.
+    """
+    now = _now()
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.status == JobStatus.queued)
+        .values(status=JobStatus.running, stage="loading_model", progress=0.0, started_at=now, updated_at=now)
+    )
+    with _session(session) as s:
+        claimed = s.exec(stmt).rowcount == 1
         s.commit()
+    if not claimed:
+        return False
+    _job_changed(job_id)
+    return True
 
 
 def update_job_progress(
@@ -165,9 +344,10 @@ def update_job_progress(
     progress: float,
     stage: str | None = None,
     eta_seconds: float | None = None,
+    session: Optional[Session] = None,
 ) -> None:
     p = max(0.0, min(1.0, float(progress)))
-    with get_session() as s:
+    with _session(session) as s:
         job = s.get(Job, job_id)
         if not job:
             return
@@ -178,6 +358,7 @@ def update_job_progress(
         job.updated_at = _now()
         s.add(job)
         s.commit()
+    _job_changed(job_id)
 
 
 def update_job_status(
@@ -186,8 +367,9 @@ def update_job_status(
     status: JobStatus,
     result_ref: Optional[str] = None,
     error: Optional[str] = None,
+    session: Optional[Session] = None,
 ) -> Optional[Job]:
-    with get_session() as s:
+    with _session(session) as s:
         job = s.get(Job, job_id)
         if not job:
             return None
@@ -198,9 +380,23 @@ def update_job_status(
         s.add(job)
         s.commit()
         s.refresh(job)
-        return job
+    _job_changed(job_id)
+    return job
 
 
-def get_job(job_id: str) -> Optional[Job]:
-    with get_session() as s:
+def get_job(job_id: str, session: Optional[Session] = None) -> Optional[Job]:
+    with _session(session) as s:
         return s.get(Job, job_id)
+
+
+def delete_job(job_id: str, session: Optional[Session] = None) -> bool:
+    """Delete the job row. Returns True if deleted, False if not found."""
+    with _session(session) as s:
+        obj = s.get(Job, job_id)
+        if not obj:
+            return False
+        s.delete(obj)
+        s.commit()
+    cache.invalidate(cache.job_key(job_id))
+    events.forget_job(job_id)
+    return True
@@ -2,11 +2,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field
 
 
 class Recording(SQLModel, table=True):
     __tablename__ = "recording"
+    # listings are ORDER BY created_at DESC LIMIT n
+    __table_args__ = (Index("ix_recording_created_at_desc", text("created_at DESC")),)
 
     id: str = Field(primary_key=True, index=True)
     original_ext: str
@@ -14,14 +17,21 @@ class Recording(SQLModel, table=True):
     duration_s: float = 0.0
     sha256: str
     created_at: datetime
+    created_at_iso: Optional[str] = None  # UTC ISO-8601, served as-is by list views
     # NOTE: intentionally no Relationship field here
 
 
 class Transcript(SQLModel, table=True):
     __tablename__ = "transcript"
+    # listings are ORDER BY created_at DESC LIMIT n; per-recording listings
+    # filter on recording_id first (range scan + LIMIT, no sort)
+    __table_args__ = (
+        Index("ix_transcript_created_at_desc", text("created_at DESC")),
+        Index("ix_transcript_rec_created", "recording_id", "created_at"),
+    )
 
     id: str = Field(primary_key=True, index=True)
-    recording_id: str = Field(foreign_key="recording.id", index=True)
+    recording_id: str = Field(foreign_key="recording.id")  # indexed by ix_transcript_rec_created
 
     # artifacts
     text_path: str
@@ -35,6 +45,10 @@ class Transcript(SQLModel, table=True):
     compute: str
     duration_s: Optional[float] = None
     created_at: datetime
+    created_at_iso: Optional[str] = None  # UTC ISO-8601, served as-is by list views
+
+    # first ~200 chars of the text, so listings don't have to open every .txt
+    text_preview: Optional[str] = Field(default=None, max_length=220)
 
     # user-facing metadata
     title: Optional[str] = None
@@ -1,7 +1,10 @@
 # orate/db/session.py
 from __future__ import annotations
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event, inspect, text
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 import os
 
 # store db under the repo root by default
@@ -11,9 +14,103 @@ DB_URL = f"sqlite:///{DB_PATH}"
 # check_same_thread=False allows using sessions in background tasks later
 engine = create_engine(DB_URL, echo=False, connect_args={"check_same_thread": False})
 
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _record) -> None:
+    # WAL: job progress writes don't block API reads; NORMAL is durable under WAL
+    # with one fsync per checkpoint instead of per commit.
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cur.execute("PRAGMA cache_size=-65536")    # 64 MiB
+    cur.close()
+
 def init_db() -> None:
     """Create tables if they don't exist."""
+    from orate.db import models  # noqa: F401  (registers tables on the metadata)
+
     SQLModel.metadata.create_all(engine)
+    _add_missing_columns()
+    _create_missing_indexes()
+    _drop_obsolete_indexes()
+    _backfill_text_previews()
+    _backfill_created_at_iso()
+
+def _add_missing_columns() -> None:
+    """
+    create_all() never alters existing tables, so nullable columns added to the
+    models later are appended here with ALTER TABLE (no Alembic in this project).
+    """
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not insp.has_table(table.name):
+                continue
+            existing = {c["name"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name in existing or not col.nullable:
+                    continue
+                col_type = col.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{col.name}" {col_type}'))
+
+def _create_missing_indexes() -> None:
+    """create_all() skips indexes on tables that already exist; add any that are new."""
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+# indexes older schemas created that a newer one makes redundant
+_OBSOLETE_INDEXES = (
+    "ix_transcript_recording_id",  # prefix of ix_transcript_rec_created
+)
 
+def _drop_obsolete_indexes() -> None:
+    with engine.begin() as conn:
+        for name in _OBSOLETE_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+
+def _backfill_text_previews() -> None:
+    """Populate transcript.text_preview for rows created before the column existed."""
+    from orate.services.storage import read_text, text_preview
+
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text("SELECT id, text_path FROM transcript WHERE text_preview IS NULL")
+        ).all()
+        for tr_id, text_path in rows:
+            preview = ""
+            try:
+                if text_path and Path(text_path).exists():
+                    preview = text_preview(read_text(Path(text_path)))
+            except Exception:
+                preview = ""
+            conn.execute(
+                text("UPDATE transcript SET text_preview = :p WHERE id = :id"),
+                {"p": preview, "id": tr_id},
+            )
+
+def _backfill_created_at_iso() -> None:
+    """Populate created_at_iso for rows created before the column existed."""
+    with engine.begin() as conn:
+        for table in ("recording", "transcript"):
+            rows = conn.execute(
+                text(f"SELECT id, created_at FROM {table} WHERE created_at_iso IS NULL")
+            ).all()
+            for row_id, created_at in rows:
+                dt = created_at if isinstance(created_at, datetime) else datetime.fromisoformat(str(created_at))
+                conn.execute(
+                    text(f"UPDATE {table} SET created_at_iso = :iso WHERE id = :id"),
+                    {"iso": dt.replace(tzinfo=timezone.utc).isoformat(), "id": row_id},
+                )
+
+# expire_on_commit=False: crud returns objects after commit/close; every column
+# is client-assigned, so there's nothing to re-read from the DB
 def get_session() -> Session:
-    return Session(engine)
+    return Session(engine, expire_on_commit=False)
+
+def get_db() -> Iterator[Session]:
+    """FastAPI dependency: one session per request, shared by every crud call in it."""
+    with Session(engine, expire_on_commit=False) as s:
+        yield s
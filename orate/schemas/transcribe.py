@@ -20,8 +20,11 @@ class TranscribeRequest(BaseModel):
     temperature: Optional[float] = None
     prompt: Optional[str] = None
     condition_on_previous_text: Optional[bool] = None
-    vad: Optional[bool] = None
+    vad: Optional[bool] = None             # default on
+    vad_min_silence_ms: Optional[int] = None
+    vad_speech_pad_ms: Optional[int] = None
     word_timestamps: Optional[bool] = None
+    batch_size: Optional[int] = None       # batched inference; 0/1 = sequential decode
 
     # NEW: speaker diarization (pyannote) – optional
     diarize: Optional[bool] = None
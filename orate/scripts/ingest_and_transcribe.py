@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 from pathlib import Path
+import os
+import shutil
 import sys
 
 from orate.services import storage, audio, whisper
@@ -25,7 +27,12 @@ def main() -> int:
     ext = src.suffix or ".mp3"
     orig = storage.original_path(rec_id, ext)
     storage.ensure_dir(orig.parent)
-    orig.write_bytes(src.read_bytes())
+    # hardlink when on the same filesystem (instant, no extra space); otherwise
+    # copyfile, which stays in the kernel (sendfile/copy_file_range)
+    try:
+        os.link(src, orig)
+    except OSError:
+        shutil.copyfile(src, orig)
 
     # 2) probe duration + sha
     try:
@@ -46,11 +53,14 @@ def main() -> int:
 
     # 4) transcribe directly from the original file; write txt+srt next to it
     out_prefix = storage.recording_dir(rec_id) / "transcript"
-    text, info = whisper.transcribe_audio(
+    result = whisper.transcribe_audio(
         audio_path=orig,
         out_prefix=out_prefix,
         opts=whisper.TranscribeOpts(model="small", device="cpu"),
         write_srt=True,
+        resampled_path=storage.resampled_path(rec_id),
+        keep_text=False,
+        precomputed_sha=sha,
     )
 
     # 5) write a small manifest (optional but handy)
@@ -61,9 +71,9 @@ def main() -> int:
         "sha256": sha,
         "model": "small",
         "device": "cpu",
-        "compute": "int8",
-        "language": getattr(info, "language", None),
-        "language_probability": getattr(info, "language_probability", None),
+        "compute": result.compute,
+        "language": result.language,
+        "language_probability": result.language_probability,
         "created_at": storage.utc_now_iso(),
     })
 
@@ -76,12 +86,13 @@ def main() -> int:
         recording_id=rec_id,
         text_path=txt_path,
         srt_path=srt_path,
-        language=getattr(info, "language", None),
-        language_probability=getattr(info, "language_probability", None),
+        language=result.language,
+        language_probability=result.language_probability,
         model="small",
         device="cpu",
-        compute="int8",
-        duration_s=getattr(info, "duration", None),
+        compute=result.compute,
+        duration_s=result.duration_sec,
+        text_preview=result.preview,
     )
 
     print("recording_id:", rec_id)
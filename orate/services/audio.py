@@ -7,11 +7,48 @@ import json
 def _run(cmd: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, check=True, capture_output=True)
 
+def _header_duration(path: Path) -> float | None:
+    """Duration from the container header, in-process (no ffprobe fork)."""
+    # WAV/FLAC/OGG (and MP3 with libsndfile >= 1.1)
+    try:
+        import soundfile as sf
+
+        info = sf.info(str(path))
+        if info.samplerate and info.frames > 0:
+            return info.frames / info.samplerate
+    except Exception:
+        pass
+
+    # MP3/M4A/etc. header parse, if mutagen is installed (optional)
+    try:
+        import mutagen
+
+        f = mutagen.File(str(path))
+        if f is not None and f.info and f.info.length:
+            return float(f.info.length)
+    except Exception:
+        pass
+
+    # PyAV reads the container metadata (already a faster-whisper dependency)
+    try:
+        import av
+
+        with av.open(str(path)) as c:
+            if c.duration:
+                return c.duration / av.time_base
+    except Exception:
+        pass
+    return None
+
 def probe_duration(path: Path) -> float:
     """
-    Return duration in seconds using ffprobe.
-    Requires ffmpeg/ffprobe to be on PATH.
+    Return duration in seconds. Reads the header in-process when possible;
+    falls back to ffprobe (must be on PATH).
     """
+    dur = _header_duration(path)
+    if dur is not None:
+        return dur
+
     cmd = [
         "ffprobe", "-v", "error", "-print_format", "json",
         "-show_entries", "format=duration",
@@ -0,0 +1,109 @@
+# orate/services/cache.py
+"""
+Short-TTL cache for hot polling endpoints (job status, transcript fetch).
+
+Uses Redis when ORATE_REDIS_URL is set and the `redis` package is installed;
+otherwise falls back to an in-process dict with per-key expiry. Cache errors
+are never fatal: callers just fall through to the DB.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Optional, Tuple
+import json
+import os
+import threading
+import time
+
+JOB_TTL_S = 2          # covers front-end poll jitter without going stale
+
+
+class _MemoryCache:
+    """Minimal get/setex/delete subset of the Redis API."""
+
+    _MAX_KEYS = 1024
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if len(self._data) >= self._MAX_KEYS:
+                # drop expired entries first; if still full, start over
+                self._data = {k: v for k, v in self._data.items() if v[0] >= now}
+                if len(self._data) >= self._MAX_KEYS:
+                    self._data.clear()
+            self._data[key] = (now + ttl, value)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for k in keys:
+                self._data.pop(k, None)
+
+
+def _make_client():
+    url = os.getenv("ORATE_REDIS_URL")
+    if url:
+        try:
+            import redis
+
+            return redis.Redis.from_url(url)
+        except Exception:
+            pass
+    return _MemoryCache()
+
+
+_client = _make_client()
+
+# Redis is shared by every API process, so PATCH/DELETE invalidate it for all of
+# them. The in-process fallback can't be invalidated from another process:
+# keep entries briefly there, and don't hold whole transcript bodies in it.
+SHARED = not isinstance(_client, _MemoryCache)
+TRANSCRIPT_TTL_S = 300 if SHARED else 2  # transcripts only change via PATCH/DELETE
+
+
+def get_json(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        raw = _client.get(key)
+    except Exception:
+        return None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def set_json(key: str, value: Dict[str, Any], ttl: int) -> None:
+    try:
+        _client.setex(key, ttl, json.dumps(value))
+    except Exception:
+        pass
+
+
+def invalidate(*keys: str) -> None:
+    try:
+        _client.delete(*keys)
+    except Exception:
+        pass
+
+
+def job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def transcript_keys(transcript_id: str) -> Tuple[str, str]:
+    """Keys for the with-text and metadata-only variants of GET /api/transcripts/{id}."""
+    return f"transcript:{transcript_id}:text", f"transcript:{transcript_id}:meta"
@@ -0,0 +1,126 @@
+# orate/services/events.py
+"""
+Job-change notifications for GET /api/jobs/{id}/stream (server-sent events).
+
+crud calls notify_job() after every job write. Stream subscribers wait for
+the next change instead of re-querying the DB on a timer. With
+ORATE_REDIS_URL set (or a redis:// ORATE_BROKER_URL) this is Redis pub/sub
+(works across the API and Celery worker processes); otherwise an in-process
+version counter is used, which doesn't see the worker's writes (see
+CROSS_PROCESS).
+"""
+from __future__ import annotations
+from typing import Dict, Optional
+import asyncio
+import os
+import threading
+import time
+
+BROKER_URL = os.getenv("ORATE_BROKER_URL")
+# a Redis Celery broker can carry the notifications as well
+REDIS_URL = os.getenv("ORATE_REDIS_URL") or (
+    BROKER_URL if BROKER_URL and BROKER_URL.startswith(("redis://", "rediss://")) else None
+)
+
+_LOCAL_POLL_S = 0.2  # in-memory check only, no DB
+
+_versions: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def _channel(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def _make_publisher():
+    if REDIS_URL:
+        try:
+            import redis
+
+            return redis.Redis.from_url(REDIS_URL)
+        except Exception:
+            pass
+    return None
+
+
+_publisher = _make_publisher()
+
+# False when jobs run in another process (Celery) but notifications are
+# in-process only: subscribers then have to re-read the job on a short timer
+CROSS_PROCESS = _publisher is not None or not BROKER_URL
+
+
+def notify_job(job_id: str) -> None:
+    with _lock:
+        _versions[job_id] = _versions.get(job_id, 0) + 1
+    if _publisher is not None:
+        try:
+            _publisher.publish(_channel(job_id), "1")
+        except Exception:
+            pass
+
+
+def forget_job(job_id: str) -> None:
+    notify_job(job_id)
+    with _lock:
+        _versions.pop(job_id, None)
+
+
+class _LocalSubscription:
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._seen = self._version()
+
+    def _version(self) -> Optional[int]:
+        with _lock:
+            return _versions.get(self.job_id)
+
+    async def __aenter__(self) -> "_LocalSubscription":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def wait(self, timeout: float) -> None:
+        """Return after the next change to the job, or after `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            v = self._version()
+            if v != self._seen:
+                self._seen = v
+                return
+            await asyncio.sleep(_LOCAL_POLL_S)
+
+
+class _RedisSubscription:
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+
+    async def __aenter__(self) -> "_RedisSubscription":
+        import redis.asyncio as aioredis
+
+        self._client = aioredis.Redis.from_url(REDIS_URL)
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(_channel(self.job_id))
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        try:
+            await self._pubsub.unsubscribe()
+            await self._pubsub.aclose()
+            await self._client.aclose()
+        except Exception:
+            pass
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        except Exception:
+            await asyncio.sleep(timeout)
+
+
+def subscribe(job_id: str):
+    """Async context manager whose .wait(timeout) returns on the next job change."""
+    if _publisher is not None:
+        return _RedisSubscription(job_id)
+    return _LocalSubscription(job_id)
@@ -0,0 +1,123 @@
+# orate/services/jobs.py
+from __future__ import annotations
+from pathlib import Path
+import time
+
+from orate.schemas.transcribe import TranscribeRequest
+from orate.services import storage, whisper
+from orate.services.audio import probe_duration
+from orate.db import crud
+from orate.db.models import JobStatus
+
+# progress writes are throttled: the UI polls ~1/s, every extra UPDATE is a SQLite commit
+_PROGRESS_MIN_INTERVAL_S = 1.0
+_PROGRESS_MIN_DELTA = 0.01
+
+
+def run_transcription_job(job_id: str, payload: TranscribeRequest) -> None:
+    """
+    Run a queued transcription job: decode, write the transcript files and row,
+    and record progress/status on the job. In-process (BackgroundTasks) or in
+    the Celery worker.
+
+    Only a job still `queued` is run; a redelivered task (Celery acks_late) for
+    a job another run already claimed or finished is a no-op.
+    """
+    if not crud.mark_job_running(job_id):
+        return
+
+    rec = crud.get_recording(payload.recording_id)
+    if not rec:
+        crud.update_job_status(job_id, status=JobStatus.error, error="recording_not_found")
+        return
+
+    orig_path = Path(rec.original_path)
+    if not orig_path.exists():
+        crud.update_job_status(job_id, status=JobStatus.error, error="original_missing")
+        return
+
+    total = float(rec.duration_s or 0.0)
+    if total <= 0:
+        try:
+            total = float(probe_duration(orig_path))
+        except Exception:
+            total = 0.0
+
+    t0 = time.time()
+    last_write = [0.0, 0.0]  # (time, progress) of the last DB write
+
+    def _progress_cb(decoded_s: float):
+        now = time.time()
+        elapsed = now - t0
+        if total > 0:
+            prog = min(decoded_s / total, 0.99)
+            eta = (elapsed / max(prog, 1e-3)) * (1.0 - prog)
+        else:
+            prog = min(0.9, elapsed / 60.0)
+            eta = None
+
+        reached_end = prog >= 0.99 > last_write[1]
+        if (
+            not reached_end
+            and now - last_write[0] < _PROGRESS_MIN_INTERVAL_S
+            and prog - last_write[1] < _PROGRESS_MIN_DELTA
+        ):
+            return
+        last_write[0], last_write[1] = now, prog
+        crud.update_job_progress(job_id, progress=prog, stage="decoding", eta_seconds=eta)
+
+    try:
+        out_prefix = storage.recording_dir(payload.recording_id) / "transcript"
+        opts = whisper.TranscribeOpts(
+            model=payload.model,
+            device=payload.device,
+            compute=payload.compute,
+            language=payload.language,
+            srt=payload.srt,
+            beam_size=payload.beam_size,
+            best_of=payload.best_of,
+            temperature=payload.temperature,
+            prompt=payload.prompt,
+            condition_on_previous_text=payload.condition_on_previous_text,
+            vad=payload.vad,
+            vad_min_silence_ms=payload.vad_min_silence_ms,
+            vad_speech_pad_ms=payload.vad_speech_pad_ms,
+            word_timestamps=payload.word_timestamps,
+            batch_size=payload.batch_size,
+            diarize=payload.diarize,  # NEW
+        ).resolved()
+
+        crud.update_job_progress(job_id, progress=0.01, stage="loading_model", eta_seconds=None)
+
+        result = whisper.transcribe_audio(
+            audio_path=orig_path,
+            out_prefix=out_prefix,
+            opts=opts,
+            write_srt=bool(payload.srt),
+            progress_cb=_progress_cb,
+            resampled_path=storage.resampled_path(payload.recording_id),
+            keep_text=False,  # the files are the transcript; the row only needs the preview
+            precomputed_sha=rec.sha256,  # hashed at upload
+        )
+
+        crud.update_job_progress(job_id, progress=0.99, stage="writing_output", eta_seconds=0)
+
+        tr_id = storage.new_id("tr")
+        crud.create_transcript(
+            id=tr_id,
+            recording_id=payload.recording_id,
+            text_path=str(out_prefix.with_suffix(".txt")),
+            srt_path=str(out_prefix.with_suffix(".srt")) if payload.srt else None,
+            language=result.language,
+            language_probability=result.language_probability,
+            model=opts.model,
+            device=opts.device,
+            compute=result.compute,
+            duration_s=result.duration_sec,
+            text_preview=result.preview,
+        )
+
+        crud.update_job_status(job_id, status=JobStatus.done, result_ref=tr_id)
+
+    except Exception as e:
+        crud.update_job_status(job_id, status=JobStatus.error, error=str(e))
@@ -7,6 +7,11 @@ import json
 import uuid
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # optional: C encoder, emits UTF-8 bytes directly
+except ImportError:
+    orjson = None
+
 # Root for all recordings
 DATA_ROOT = Path("data")
 
@@ -28,6 +33,10 @@ def original_path(recording_id: str, ext: str) -> Path:
         ext = "." + ext
     return recording_dir(recording_id) / f"original{ext}"
 
+def resampled_path(recording_id: str) -> Path:
+    """16 kHz mono copy of the original, decoded once and reused by every transcription."""
+    return recording_dir(recording_id) / "audio16k.wav"
+
 def transcript_txt_path(recording_id: str) -> Path:
     return recording_dir(recording_id) / "transcript.txt"
 
@@ -47,19 +56,43 @@ def write_text(path: Path, text: str) -> None:
     ensure_dir(path.parent)
     path.write_text(text, encoding="utf-8")
 
+def read_text(path: Path) -> str:
+    """
+    Slurp a UTF-8 text file with one unbuffered read (no BufferedReader/TextIOWrapper).
+    Newlines are normalized like Path.read_text (files written on Windows have CRLF).
+    """
+    with open(path, "rb", buffering=0) as f:
+        data = f.read().decode("utf-8")
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    return data
+
 def write_json(path: Path, obj: Dict[str, Any]) -> None:
     ensure_dir(path.parent)
-    path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
 def read_json(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 def sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
-    h = hashlib.sha256()
+    # hashlib.sha256 is OpenSSL's implementation (SHA-NI / ARMv8 SHA2 when the
+    # CPU has them); keep every file hash going through here.
     with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # 3.11+: reads into one reused buffer
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(chunk_size), b""):
             h.update(chunk)
     return h.hexdigest()
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
+
+def text_preview(text: str, limit: int = 200) -> str:
+    """Single-line preview stored on the transcript row for list views."""
+    return text[:limit].replace("\n", " ")
@@ -0,0 +1,43 @@
+# orate/services/threads.py
+"""
+CPU thread budget for CTranslate2 (faster-whisper) and OpenMP.
+
+CTranslate2 slows down with more threads than physical cores (OpenMP spinning,
+shared caches). OpenMP reads OMP_NUM_THREADS when the library loads, so this
+module sets it on import, before numpy/faster_whisper are imported; the
+`orate` package imports it first for that reason.
+"""
+from __future__ import annotations
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+# one decode stream stops scaling well past this many threads
+_MAX_AUTO_THREADS = 8
+
+
+def _physical_cores() -> int:
+    env = os.getenv("ORATE_CPU_THREADS")
+    if env:
+        try:
+            n = int(env)
+            if n >= 1:
+                return n
+        except ValueError:
+            pass
+        log.warning("ignoring ORATE_CPU_THREADS=%r (expected a positive integer)", env)
+    n = None
+    try:
+        import psutil  # optional
+
+        n = psutil.cpu_count(logical=False)
+    except Exception:
+        pass
+    if not n:
+        n = max(1, (os.cpu_count() or 2) // 2)  # assume SMT
+    return min(n, _MAX_AUTO_THREADS)
+
+
+CPU_THREADS = _physical_cores()
+os.environ.setdefault("OMP_NUM_THREADS", str(CPU_THREADS))
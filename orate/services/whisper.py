@@ -1,14 +1,52 @@
 # orate/services/whisper.py
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Callable, Tuple, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import contextlib
+import queue
+import threading
 import time
-import hashlib
 import os
 
-from pydantic import BaseModel, ConfigDict, field_validator
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper.vad import get_vad_model
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
+
+from orate.services.storage import sha256_file, text_preview
+from orate.services.threads import CPU_THREADS
+
+
+DEFAULT_BATCH_SIZE = 8
+# shorter clips are a handful of VAD chunks: batching buys nothing over the
+# sequential path there
+BATCHED_MIN_DURATION_S = 60.0
+
+# fastest first: INT8 weights halve the bandwidth of the (memory-bound) decoder;
+# int8_float16 keeps activations on fp16 tensor cores
+_COMPUTE_PREFERENCE = {
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+    "cpu": ("int8", "int8_float32", "float32"),
+}
+
+
+@lru_cache(maxsize=None)
+def _pick_compute(device: str) -> str:
+    """Best compute type this machine supports for `device`; "auto" if it can't tell."""
+    try:
+        import ctranslate2  # local: only needed once per device
+
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        return "auto"
+    for ct in _COMPUTE_PREFERENCE.get(device, ()):
+        if ct in supported:
+            return ct
+    return "auto"
 
 
 class TranscribeOpts(BaseModel):
@@ -19,100 +57,337 @@ class TranscribeOpts(BaseModel):
     srt: Optional[bool] = False
 
     # accepted but optional; ignored if None
-    vad: Optional[bool] = None
+    vad: Optional[bool] = None  # None -> on; skips silence before decoding
+    vad_min_silence_ms: Optional[int] = None
+    vad_speech_pad_ms: Optional[int] = None
     beam_size: Optional[int] = None
     best_of: Optional[int] = None
     temperature: Optional[float] = None
     prompt: Optional[str] = None
     condition_on_previous_text: Optional[bool] = None
     word_timestamps: Optional[bool] = None
+    # batched inference over VAD chunks; None -> DEFAULT_BATCH_SIZE, 0/1 -> sequential
+    batch_size: Optional[int] = None
 
     # NEW: diarization toggle
     diarize: Optional[bool] = None
 
+    # CTranslate2 threads per model; None -> CPU_THREADS / 1 worker
+    cpu_threads: Optional[int] = None
+    num_workers: Optional[int] = None
+
     # ignore future/unknown keys so UI changes don't break API
     model_config = ConfigDict(extra="ignore")
 
+    # set on the copies resolved() returns, so resolving again is free
+    _resolved: bool = PrivateAttr(default=False)
+
     @field_validator("model", "device", "compute")
     @classmethod
     def _lower(cls, v: Optional[str]) -> Optional[str]:
         return v.lower() if isinstance(v, str) else v
 
     def resolved(self) -> "TranscribeOpts":
-        # choose device/compute defaults if omitted
+        if self._resolved:
+            return self
+        # choose device/compute defaults if omitted: int8_float16 on GPUs with INT8
+        # kernels (float16 where they're missing), int8 on CPU
         dev = (self.device or "cpu").lower()
-        comp = self.compute or ("float16" if dev == "cuda" else "int8")
-        return TranscribeOpts(
+        comp = self.compute or _pick_compute(dev)
+        r = TranscribeOpts(
             model=self.model or "small",
             device=dev,
             compute=comp,
             language=self.language,
             srt=bool(self.srt),
             vad=self.vad,
-            beam_size=self.beam_size,
+            vad_min_silence_ms=self.vad_min_silence_ms if self.vad_min_silence_ms is not None else 500,
+            vad_speech_pad_ms=self.vad_speech_pad_ms if self.vad_speech_pad_ms is not None else 200,
+            beam_size=self.beam_size if self.beam_size is not None else 1,  # greedy; faster-whisper defaults to 5
             best_of=self.best_of,
             temperature=self.temperature,
             prompt=self.prompt,
             condition_on_previous_text=self.condition_on_previous_text,
             word_timestamps=self.word_timestamps,
+            batch_size=DEFAULT_BATCH_SIZE if self.batch_size is None else self.batch_size,
             diarize=self.diarize,
+            cpu_threads=self.cpu_threads or CPU_THREADS,
+            num_workers=self.num_workers or 1,  # one transcription per model at a time
         )
+        r._resolved = True
+        return r
 
 
 class TranscribeResult(BaseModel):
-    text: str
+    text: Optional[str]  # None when transcribe_audio(keep_text=False)
     srt: Optional[str]
+    preview: str = ""  # storage.text_preview() of the text, always set
     language: str
+    language_probability: Optional[float] = None
     duration_sec: float
     processing_sec: float
     sha256: str
-
-
-def _sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1 << 20), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    compute: str  # compute type actually in use (resolves "auto")
+    duration_after_vad_sec: Optional[float] = None  # audio actually decoded
 
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-_model_cache: Dict[Tuple[str, str, str], WhisperModel] = {}
+# (model, device, compute) -> loaded model, least recently used first. Bounded:
+# each entry pins its weights in RAM/VRAM.
+MODEL_CACHE_SIZE = int(os.getenv("ORATE_MODEL_CACHE_SIZE", "4"))
+_ModelKey = Tuple[str, str, str, int, int]
+_model_cache: "OrderedDict[_ModelKey, WhisperModel]" = OrderedDict()
+_model_lock = threading.Lock()  # guards the dicts only, never held while loading
+_model_load_locks: Dict[_ModelKey, threading.Lock] = {}  # one per model being loaded
+
+# Optional dir of models converted ahead of time with the weights already
+# quantized, e.g.
+#   ct2-transformers-converter --model openai/whisper-large-v3 \
+#       --quantization int8 --output_dir $ORATE_MODEL_DIR/whisper-large-v3-int8
+# Loading these skips the hub download and the load-time float16 -> int8
+# conversion, and the files on disk are ~half the size.
+MODEL_DIR = os.getenv("ORATE_MODEL_DIR")
+
+
+def _model_path(model: str, compute: str) -> str:
+    """Local pre-converted model dir if one exists, else the name for faster-whisper to fetch."""
+    if MODEL_DIR:
+        for name in (f"whisper-{model}-{compute}", f"whisper-{model}", model):
+            p = Path(MODEL_DIR) / name
+            if (p / "model.bin").is_file():
+                return str(p)
+    return model
+
+
+def _model_key(o: TranscribeOpts) -> _ModelKey:
+    return (o.model, o.device, o.compute, o.cpu_threads, o.num_workers)
+
+
+def _cached_model(key: _ModelKey) -> Optional[WhisperModel]:
+    with _model_lock:
+        m = _model_cache.get(key)
+        if m is not None:
+            _model_cache.move_to_end(key)
+        return m
 
 
 def load_model(opts: TranscribeOpts) -> WhisperModel:
     o = opts.resolved()
-    key = (o.model, o.device, o.compute)
-    m = _model_cache.get(key)
+    key = _model_key(o)
+    m = _cached_model(key)
     if m is not None:
         return m
-    m = WhisperModel(
-        model_size_or_path=o.model,
-        device=o.device,
-        compute_type=o.compute,
-    )
-    _model_cache[key] = m
+
+    # concurrent jobs asking for the same uncached model wait on its lock and
+    # load the weights once (possibly a hub download); other models aren't held up
+    with _model_lock:
+        load_lock = _model_load_locks.setdefault(key, threading.Lock())
+    with load_lock:
+        m = _cached_model(key)
+        if m is not None:
+            return m
+        m = WhisperModel(
+            model_size_or_path=_model_path(o.model, o.compute),
+            device=o.device,
+            compute_type=o.compute,
+            cpu_threads=o.cpu_threads,
+            num_workers=o.num_workers,
+        )
+        with _model_lock:
+            _model_cache[key] = m
+            _model_load_locks.pop(key, None)  # later callers hit the cache
+            while len(_model_cache) > MODEL_CACHE_SIZE:
+                old, _ = _model_cache.popitem(last=False)
+                _pipeline_cache.pop(old, None)  # wraps the evicted model
     return m
 
 
-def _try_diarize(audio_path: Path) -> Optional[List[Tuple[float, float, str]]]:
-    """Return list of (start, end, speaker) or None if diarization unavailable."""
+_pipeline_cache: Dict[_ModelKey, BatchedInferencePipeline] = {}
+
+
+def load_batched_pipeline(opts: TranscribeOpts) -> BatchedInferencePipeline:
+    """BatchedInferencePipeline wrapping the cached model (batch size is per call)."""
+    o = opts.resolved()
+    key = _model_key(o)
+    model = load_model(o)
+    # under _model_lock, like eviction: only cache a pipeline whose model is
+    # still cached, so it can't pin weights evicted in the meantime
+    with _model_lock:
+        p = _pipeline_cache.get(key)
+        if p is not None and p.model is model:
+            return p
+        p = BatchedInferencePipeline(model=model)
+        if _model_cache.get(key) is model:
+            _pipeline_cache[key] = p
+    return p
+
+
+SAMPLE_RATE = 16000  # what Whisper's feature extractor expects
+
+
+# recently decoded arrays, keyed by (path, mtime_ns, size), within a budget of
+# ORATE_AUDIO_CACHE_S seconds of audio in total (1800 s ~ 115 MB of float32)
+AUDIO_CACHE_S = float(os.getenv("ORATE_AUDIO_CACHE_S", "1800"))
+_audio_cache: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+_audio_cache_lock = threading.Lock()
+
+
+def _load_audio(audio_path: Path, cache_path: Optional[Path] = None) -> np.ndarray:
+    """
+    Decode + resample to 16 kHz mono float32 (in-process via PyAV; no ffmpeg
+    subprocess). Recent results are kept in memory; with cache_path, the decoded
+    audio is also kept as a PCM16 WAV (what faster-whisper resamples to anyway),
+    so re-transcribing a recording skips the decode entirely.
+    """
     try:
-        from pyannote.audio import Pipeline
-    except Exception:
-        return None
+        st = audio_path.stat()
+        key: Optional[Tuple[str, int, int]] = (str(audio_path.resolve()), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None:
+        with _audio_cache_lock:
+            hit = _audio_cache.get(key)
+            if hit is not None:
+                _audio_cache.move_to_end(key)
+                return hit
+
+    audio = _decode_audio(audio_path, cache_path)
+
+    budget = int(AUDIO_CACHE_S * SAMPLE_RATE)
+    if key is not None and len(audio) <= budget:
+        with _audio_cache_lock:
+            _audio_cache[key] = audio
+            while sum(len(a) for a in _audio_cache.values()) > budget:
+                _audio_cache.popitem(last=False)
+    return audio
+
+
+def _decode_audio(audio_path: Path, cache_path: Optional[Path]) -> np.ndarray:
+    import soundfile as sf
+
+    if cache_path is not None:
+        try:
+            audio, _ = sf.read(str(cache_path), dtype="float32")
+            return audio
+        except Exception:
+            pass  # missing or partial -> decode again
+
+    audio = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+    if cache_path is not None:
+        try:
+            tmp = cache_path.with_name(cache_path.name + ".part")
+            sf.write(str(tmp), audio, SAMPLE_RATE, subtype="PCM_16", format="WAV")
+            os.replace(tmp, cache_path)
+        except Exception:
+            pass  # cache is best-effort
+    return audio
+
+
+# pyannote pipeline, loaded once like _model_cache (segmentation + embedding
+# models are hundreds of MB). _diar_run_lock serializes inference on it.
+_diar_pipeline = None
+_diar_load_lock = threading.Lock()
+_diar_run_lock = threading.Lock()
+# diarization runs here while the calling thread decodes with Whisper (torch and
+# CTranslate2 both release the GIL); one worker since inference is serialized
+_diar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diarize")
+
+
+def _load_diar_pipeline():
+    """Cached pyannote Pipeline (on CUDA when available). Raises if it can't be loaded."""
+    global _diar_pipeline
+    if _diar_pipeline is not None:
+        return _diar_pipeline
+    with _diar_load_lock:
+        if _diar_pipeline is None:
+            from pyannote.audio import Pipeline
+
+            token = os.getenv("PYANNOTE_AUTH_TOKEN")
+            if token:
+                pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization", use_auth_token=token)
+            else:
+                # Some environments may work without a token if cached.
+                pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization")
+            if pipeline is None:  # gated model without access
+                raise RuntimeError("pyannote pipeline unavailable")
+            try:
+                import torch
+
+                if torch.cuda.is_available():
+                    pipeline.to(torch.device("cuda"))
+            except Exception:
+                pass
+            _diar_pipeline = pipeline
+    return _diar_pipeline
+
+
+_vad_lock = threading.Lock()
+
+
+def _warm_vad() -> None:
+    """
+    Build faster-whisper's Silero VAD session (get_vad_model() is lru_cached, so
+    this is free afterwards). The lock keeps concurrent first jobs from each
+    building one.
+    """
+    with _vad_lock:
+        get_vad_model()
+
+
+def preload(opts: Optional[TranscribeOpts] = None) -> WhisperModel:
+    """
+    Load + cache the model and run one short silent decode, so the first job
+    doesn't pay the one-time costs (CUDA context, cuBLAS/cuDNN handles and
+    workspaces, allocator pools).
+    """
+    o = (opts or TranscribeOpts()).resolved()
+    model = load_model(o)
+    if o.vad is not False:
+        _warm_vad()
+    segments, _ = model.transcribe(
+        np.zeros(SAMPLE_RATE, dtype=np.float32),  # padded to one 30 s window
+        language=o.language or "en",  # skip language detection
+        beam_size=o.beam_size,
+        vad_filter=False,  # VAD would drop the silence and skip the decode
+    )
+    for _ in segments:
+        pass
+    return model
+
+
+def preload_from_env() -> None:
+    """
+    preload() the model named by ORATE_PRELOAD_MODEL (device: ORATE_PRELOAD_DEVICE),
+    if set. The VAD session is loaded either way: it's small and model-independent.
+    """
+    name = os.getenv("ORATE_PRELOAD_MODEL")
+    if name:
+        preload(TranscribeOpts(model=name, device=os.getenv("ORATE_PRELOAD_DEVICE")))
+    else:
+        _warm_vad()
+
 
-    token = os.getenv("PYANNOTE_AUTH_TOKEN")
+def _try_diarize(
+    audio_path: Path,
+    audio: Optional[np.ndarray] = None,
+) -> Optional[List[Tuple[float, float, str]]]:
+    """
+    Return list of (start, end, speaker) or None if diarization unavailable.
+    `audio` is the already-decoded 16 kHz mono signal, so pyannote needn't decode again.
+    """
     try:
-        if token:
-            pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization", use_auth_token=token)
+        pipeline = _load_diar_pipeline()
+        if audio is not None:
+            import torch
+
+            inp: Any = {"waveform": torch.from_numpy(audio).unsqueeze(0), "sample_rate": SAMPLE_RATE}
         else:
-            # Some environments may work without a token if cached.
-            pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization")
-        diar = pipeline(str(audio_path))
+            inp = str(audio_path)
+        with _diar_run_lock:
+            diar = pipeline(inp)
         entries: List[Tuple[float, float, str]] = []
         for segment, _, label in diar.itertracks(yield_label=True):
             entries.append((float(segment.start), float(segment.end), str(label)))
@@ -131,35 +406,129 @@ def _try_diarize(audio_path: Path) -> Optional[List[Tuple[float, float, str]]]:
 
 
 def _assign_speakers_to_segments(
-    whisper_segments,
+    seg_starts: List[float],
+    seg_ends: List[float],
     diar_segments: List[Tuple[float, float, str]]
 ) -> Dict[int, str]:
-    """Greedy overlap: for each whisper segment i, choose speaker with max overlap."""
-    def overlap(a0, a1, b0, b1):
-        lo = max(a0, b0)
-        hi = min(a1, b1)
-        return max(0.0, hi - lo)
+    """
+    Greedy overlap: for each whisper segment i, choose speaker with max overlap
+    (ties go to the earlier diarization turn).
+
+    Turns are sorted by start, so binary search narrows each segment to the
+    turns that can overlap it: start < seg.end, and running-max end > seg.start
+    (turns may overlap each other). Only that window is compared, in NumPy.
+    """
+    if not seg_starts or not diar_segments:
+        return {}
+    d = np.array([(s0, s1) for s0, s1, _ in diar_segments], dtype=np.float64)
+    order = np.argsort(d[:, 0], kind="stable")
+    d_starts, d_ends = d[order, 0], d[order, 1]
+    max_end = np.maximum.accumulate(d_ends)
+    d_spk = [diar_segments[k][2] for k in order]
+
+    w_starts = np.asarray(seg_starts, dtype=np.float64)
+    w_ends = np.asarray(seg_ends, dtype=np.float64)
+    los = np.searchsorted(max_end, w_starts, side="right")
+    his = np.searchsorted(d_starts, w_ends, side="left")
 
     mapping: Dict[int, str] = {}
-    for i, seg in enumerate(whisper_segments):
-        best_spk = None
-        best_ov = 0.0
-        for (s0, s1, spk) in diar_segments:
-            ov = overlap(seg.start, seg.end, s0, s1)
-            if ov > best_ov:
-                best_ov = ov
-                best_spk = spk
-        if best_spk:
-            mapping[i] = best_spk
+    for i in np.flatnonzero(his > los):
+        lo, hi = los[i], his[i]
+        ov = np.minimum(d_ends[lo:hi], w_ends[i]) - np.maximum(d_starts[lo:hi], w_starts[i])
+        best_ov = ov.max()
+        if best_ov > 0.0:
+            ties = np.flatnonzero(ov == best_ov) + lo
+            mapping[int(i)] = d_spk[ties[order[ties].argmin()]]
     return mapping
 
 
+class _StrippedWriter:
+    """
+    Streams pieces to a text file so that it ends up equal to "".join(pieces).strip():
+    leading whitespace is skipped and trailing whitespace is held back until
+    more text follows.
+    """
+
+    def __init__(self, f) -> None:
+        self._f = f
+        self._started = False
+        self._pending = ""
+        self.head = ""  # first ~200 chars written, for the preview
+
+    def write(self, piece: str) -> None:
+        s = self._pending + piece
+        if not self._started:
+            s = s.lstrip()
+        body = s.rstrip()
+        self._pending = s[len(body):]
+        if body:
+            self._f.write(body)
+            self._started = True
+            if len(self.head) < 200:
+                self.head += body
+
+
+# progress_cb(decoded_seconds): seg.end as faster-whisper returns it, already a float
+ProgressCB = Callable[[float], None]
+
+
+@contextlib.contextmanager
+def _progress_reporter(progress_cb: Optional[ProgressCB]):
+    """
+    Yields report(decoded_s). progress_cb runs on a daemon thread, with only the
+    newest value if several queued up, so a slow callback (DB write, publish)
+    never holds up the decode loop. Exiting waits for the last call to finish.
+    """
+    if progress_cb is None:
+        yield lambda _decoded_s: None
+        return
+
+    q: "queue.SimpleQueue[Optional[float]]" = queue.SimpleQueue()
+
+    def _drain() -> None:
+        while True:
+            latest = q.get()
+            stop = latest is None  # sentinel: decoding finished
+            while not stop and not q.empty():
+                item = q.get_nowait()
+                if item is None:
+                    stop = True
+                else:
+                    latest = item
+            if latest is not None:
+                try:
+                    progress_cb(latest)
+                except Exception:
+                    pass
+            if stop:
+                return
+
+    t = threading.Thread(target=_drain, name="orate-progress", daemon=True)
+    t.start()
+    try:
+        yield q.put_nowait
+    finally:
+        q.put_nowait(None)
+        t.join()
+
+
+def _srt_ts(ts: float) -> str:
+    """Seconds -> SRT "HH:MM:SS,mmm"."""
+    h, r = divmod(round(ts * 1000), 3_600_000)  # round: 1.14 * 1000 == 1139.999...
+    m, r = divmod(r, 60_000)
+    s, ms = divmod(r, 1000)
+    return "%02d:%02d:%02d,%03d" % (h, m, s, ms)  # printf-style: ~30% faster than the f-string specs
+
+
 def transcribe_audio(
     audio_path: Path,
     out_prefix: Path,
     opts: TranscribeOpts,
     write_srt: bool = False,
-    progress_cb=None,  # optional: progress_cb(decoded_seconds: float)
+    progress_cb: Optional[ProgressCB] = None,
+    resampled_path: Optional[Path] = None,  # optional 16 kHz cache, see _load_audio
+    keep_text: bool = True,  # False: only write the files; result.text/srt are None
+    precomputed_sha: Optional[str] = None,  # caller already hashed audio_path
 ) -> TranscribeResult:
     t0 = time.time()
     _ensure_dir(out_prefix.parent)
@@ -168,71 +537,107 @@ def transcribe_audio(
     model = load_model(o)
 
     # Build kwargs passed to faster-whisper
+    use_vad = o.vad is not False
     tx_kwargs: Dict[str, Any] = {
         "language": o.language,
-        "vad_filter": False,  # keep disabled for now even if o.vad is True
+        "vad_filter": use_vad,
         "word_timestamps": bool(o.word_timestamps) if o.word_timestamps is not None else False,
     }
+    if use_vad:
+        _warm_vad()  # first use builds the session once, even with concurrent jobs
+        tx_kwargs["vad_parameters"] = {
+            "min_silence_duration_ms": o.vad_min_silence_ms,
+            "speech_pad_ms": o.vad_speech_pad_ms,
+        }
     if o.beam_size is not None:
         tx_kwargs["beam_size"] = o.beam_size
     if o.best_of is not None:
         tx_kwargs["best_of"] = o.best_of
     if o.temperature is not None:
         tx_kwargs["temperature"] = o.temperature
+    if o.beam_size == 1:
+        # greedy: no temperature-fallback re-decodes unless asked for
+        tx_kwargs.setdefault("best_of", 1)
+        tx_kwargs.setdefault("temperature", 0.0)
     if o.prompt:
         tx_kwargs["initial_prompt"] = o.prompt
     if o.condition_on_previous_text is not None:
         tx_kwargs["condition_on_previous_text"] = o.condition_on_previous_text
 
-    # Progress proxy (best-effort)
-    def _proxy_progress(seg):
-        if progress_cb and hasattr(seg, "end"):
-            try:
-                progress_cb(float(seg.end))
-            except Exception:
-                pass
-
-    segments, info = model.transcribe(str(audio_path), **tx_kwargs)
-
-    # Optional diarization
-    diar_segments = _try_diarize(audio_path) if o.diarize else None
-    speaker_by_index: Dict[int, str] = {}
-    if diar_segments:
-        speaker_by_index = _assign_speakers_to_segments(segments, diar_segments)
-
-    txt_lines = []
-    srt_lines = []
+    audio = _load_audio(audio_path, resampled_path)
+    # Optional diarization, concurrently with decoding below
+    diar_future = _diar_executor.submit(_try_diarize, audio_path, audio) if o.diarize else None
+
+    if (
+        o.batch_size and o.batch_size > 1
+        and use_vad
+        and len(audio) > BATCHED_MIN_DURATION_S * SAMPLE_RATE
+    ):
+        # decodes VAD-split chunks in batches (several x faster on long files);
+        # it chunks by VAD, so vad=False takes the sequential path
+        pipeline = load_batched_pipeline(o)
+        segments, info = pipeline.transcribe(audio, batch_size=o.batch_size, **tx_kwargs)
+    else:
+        segments, info = model.transcribe(audio, **tx_kwargs)
+
+    # Stream .txt/.srt as segments decode (nothing accumulates unless keep_text);
+    # the files come out the same as "\n".join(lines).strip().
+    txt_lines: Optional[List[str]] = [] if keep_text else None
+    srt_blocks: Optional[List[str]] = [] if keep_text and write_srt else None
     seg_index = 1
 
-    def fmt(ts: float) -> str:
-        h = int(ts // 3600)
-        m = int((ts % 3600) // 60)
-        s = int(ts % 60)
-        ms = int((ts - int(ts)) * 1000)
-        return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-
-    for i, seg in enumerate(segments):
-        _proxy_progress(seg)
-        spk = speaker_by_index.get(i)
-        prefix = f"{spk}: " if spk else ""
-        txt_lines.append(prefix + seg.text.strip())
-
-        if write_srt:
-            srt_lines.append(str(seg_index))
-            srt_lines.append(f"{fmt(seg.start)} --> {fmt(seg.end)}")
-            srt_lines.append(prefix + seg.text.strip())
-            srt_lines.append("")
+    def _open(suffix: str) -> _StrippedWriter:
+        f = out_prefix.with_suffix(suffix).open("w", encoding="utf-8", buffering=1 << 16)
+        return _StrippedWriter(files.enter_context(f))
+
+    with _progress_reporter(progress_cb) as report, contextlib.ExitStack() as files:
+        def _rows():
+            for seg in segments:
+                report(seg.end)
+                yield seg.start, seg.end, seg.text
+
+        rows = _rows()
+        speaker_by_index: Dict[int, str] = {}
+        if diar_future is not None:
+            # speakers need every segment: decode them all (while diarization runs),
+            # keeping only the three fields used (not the Segment/Word objects),
+            # then wait for the diarization result
+            starts: List[float] = []
+            ends: List[float] = []
+            texts: List[str] = []
+            for start, end, text in rows:
+                starts.append(start)
+                ends.append(end)
+                texts.append(text)
+            rows = zip(starts, ends, texts)
+            diar_segments = diar_future.result()
+            if diar_segments:
+                speaker_by_index = _assign_speakers_to_segments(starts, ends, diar_segments)
+
+        txt_w = _open(".txt")
+        srt_w = _open(".srt") if write_srt else None
+        for i, (start, end, text) in enumerate(rows):
+            text = text.strip()
+            if not text:
+                continue  # no blank .txt lines or empty SRT cues
+            spk = speaker_by_index.get(i)
+            line = f"{spk}: {text}" if spk else text
+            txt_w.write(line if seg_index == 1 else "\n" + line)
+            if txt_lines is not None:
+                txt_lines.append(line)
+
+            if srt_w is not None:
+                block = f"{seg_index}\n{_srt_ts(start)} --> {_srt_ts(end)}\n{line}\n"
+                srt_w.write(block if seg_index == 1 else "\n" + block)
+                if srt_blocks is not None:
+                    srt_blocks.append(block)
             seg_index += 1
 
-    text_out = "\n".join(txt_lines).strip()
-    srt_out = "\n".join(srt_lines).strip() if write_srt else None
-
-    (out_prefix.with_suffix(".txt")).write_text(text_out, encoding="utf-8")
-    if srt_out is not None:
-        (out_prefix.with_suffix(".srt")).write_text(srt_out, encoding="utf-8")
+    text_out = "\n".join(txt_lines).strip() if txt_lines is not None else None
+    srt_out = "\n".join(srt_blocks).strip() if srt_blocks is not None else None
 
     processing = time.time() - t0
-    sha = _sha256_file(audio_path)
+    sha = precomputed_sha or sha256_file(audio_path)
 
     lang = getattr(info, "language", None) or o.language or "unknown"
     dur = float(getattr(info, "duration", 0.0) or 0.0)
@@ -240,8 +645,12 @@ def transcribe_audio(
     return TranscribeResult(
         text=text_out,
         srt=srt_out,
+        preview=text_preview(txt_w.head),
         language=lang,
+        language_probability=getattr(info, "language_probability", None),
         duration_sec=dur,
         processing_sec=processing,
         sha256=sha,
+        compute=str(getattr(model.model, "compute_type", o.compute)),
+        duration_after_vad_sec=getattr(info, "duration_after_vad", None),
     )
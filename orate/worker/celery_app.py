@@ -0,0 +1,48 @@
+# orate/worker/celery_app.py
+# celery -A orate.worker.celery_app worker --concurrency=1
+"""
+Optional Celery worker for transcription jobs.
+
+Enabled by setting ORATE_BROKER_URL (e.g. redis://localhost:6379/0) for both
+the API and the worker. Without it the API keeps running jobs in-process via
+FastAPI BackgroundTasks.
+"""
+from __future__ import annotations
+import os
+
+from celery import Celery
+from celery.signals import worker_process_init
+
+from orate.schemas.transcribe import TranscribeRequest
+
+BROKER_URL = os.getenv("ORATE_BROKER_URL", "redis://localhost:6379/0")
+
+VISIBILITY_TIMEOUT_S = int(os.getenv("ORATE_VISIBILITY_TIMEOUT_S", str(12 * 3600)))
+
+celery_app = Celery("orate", broker=BROKER_URL)
+celery_app.conf.update(
+    # whisper is GPU/CPU bound: one job per worker process by default (one per GPU)
+    worker_concurrency=int(os.getenv("ORATE_WORKER_CONCURRENCY", "1")),
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # with acks_late, Redis redelivers a task still unacked after this long; keep
+    # it well above the longest transcription (the job claim skips redeliveries anyway)
+    broker_transport_options={"visibility_timeout": VISIBILITY_TIMEOUT_S},
+    task_ignore_result=True,
+)
+
+
+@worker_process_init.connect
+def _preload_model(**_kwargs) -> None:
+    # warm the model in each worker process before it takes a job
+    from orate.services.whisper import preload_from_env
+
+    preload_from_env()
+
+
+@celery_app.task(name="transcribe")
+def transcribe_task(job_id: str, payload: dict) -> None:
+    # job progress/status is still written through crud, so /api/jobs/{id} polling works
+    from orate.services.jobs import run_transcription_job
+
+    run_transcription_job(job_id, TranscribeRequest(**payload))
@@ -0,0 +1,88 @@
+# tests/conftest.py
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Iterator, List
+import os
+import tempfile
+
+import pytest
+
+# orate.db.session reads ORATE_DB at import, and storage writes under ./data:
+# point both at a scratch dir before anything from orate is imported
+_WORK_DIR = tempfile.mkdtemp(prefix="orate-tests-")
+os.environ["ORATE_DB"] = os.path.join(_WORK_DIR, "orate.db")
+os.environ.pop("ORATE_REDIS_URL", None)
+os.environ.pop("ORATE_PRELOAD_MODEL", None)
+os.chdir(_WORK_DIR)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from orate.api.main import app  # noqa: E402
+from orate.db import crud  # noqa: E402
+from orate.db.session import engine  # noqa: E402
+from orate.services import storage  # noqa: E402
+
+
+@contextmanager
+def _count_queries() -> Iterator[List[str]]:
+    """Collect every SQL statement run on the engine inside the block."""
+    statements: List[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Catch N+1 regressions in endpoints:
+
+        with count_queries() as q:
+            client.get("/api/transcripts?limit=50")
+        assert len(q) <= 2
+    """
+    return _count_queries
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as c:  # runs the app lifespan, which creates the tables
+        yield c
+
+
+@pytest.fixture
+def transcript_id(client) -> str:
+    """A recording with three transcripts; returns the first transcript's id."""
+    rec_id = storage.new_id("rec")
+    tr_id = storage.new_id("tr")
+    text_path = storage.recording_dir(rec_id) / "transcript.txt"
+    storage.write_text(text_path, "hello world")
+    crud.create_recording(
+        id=rec_id,
+        original_ext=".wav",
+        original_path=str(storage.recording_dir(rec_id) / "original.wav"),
+        duration_s=1.0,
+        sha256="0" * 64,
+    )
+    for i in range(3):
+        crud.create_transcript(
+            id=tr_id if i == 0 else storage.new_id("tr"),
+            recording_id=rec_id,
+            text_path=str(text_path),
+            srt_path=None,
+            language="en",
+            language_probability=None,
+            model="small",
+            device="cpu",
+            compute="int8",
+            duration_s=1.0,
+            text_preview="hello world",
+        )
+    return tr_id
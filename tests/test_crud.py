@@ -0,0 +1,58 @@
+# tests/test_crud.py
+from __future__ import annotations
+import time
+
+from orate.db import crud
+
+
+def test_update_transcript_fields_keeps_unset_fields(transcript_id):
+    assert crud.update_transcript_fields(transcript_id, title="T") == ("T", None)
+    assert crud.update_transcript_fields(transcript_id, notes="N") == ("T", "N")
+    # None keeps the current value; an empty string is a real value
+    assert crud.update_transcript_fields(transcript_id) == ("T", "N")
+    assert crud.update_transcript_fields(transcript_id, title="") == ("", "N")
+
+    tr = crud.get_transcript(transcript_id)
+    assert (tr.title, tr.notes) == ("", "N")
+
+
+def test_update_transcript_fields_missing():
+    assert crud.update_transcript_fields("tr_missing", title="T") is None
+
+
+def test_get_transcript_sees_updates_and_deletes(transcript_id):
+    assert crud.get_transcript(transcript_id).title is None  # now cached
+    crud.update_transcript_fields(transcript_id, title="new")
+    assert crud.get_transcript(transcript_id).title == "new"
+    assert crud.delete_transcript(transcript_id)
+    assert crud.get_transcript(transcript_id) is None
+
+
+def test_row_lru_get_put_pop():
+    lru = crud._RowLRU(maxsize=2)
+    lru.put("a", 1, lru.epoch())
+    lru.put("b", 2, lru.epoch())
+    assert lru.get("a") == 1  # "b" is now least recently used
+    lru.put("c", 3, lru.epoch())
+    assert (lru.get("a"), lru.get("b"), lru.get("c")) == (1, None, 3)
+    lru.pop("a")
+    assert lru.get("a") is None
+
+
+def test_row_lru_drops_put_raced_by_invalidation():
+    lru = crud._RowLRU()
+    epoch = lru.epoch()  # a read starts...
+    lru.pop("a")         # ...an update/delete invalidates meanwhile...
+    lru.put("a", "stale", epoch)  # ...so its (old) row isn't cached
+    assert lru.get("a") is None
+
+    lru.put("a", "fresh", lru.epoch())
+    assert lru.get("a") == "fresh"
+
+
+def test_row_lru_ttl():
+    lru = crud._RowLRU(ttl_s=0.05)
+    lru.put("a", 1, lru.epoch())
+    assert lru.get("a") == 1
+    time.sleep(0.06)
+    assert lru.get("a") is None
@@ -0,0 +1,97 @@
+# tests/test_db_upgrade.py
+from __future__ import annotations
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+
+from orate.db import session as db_session
+from orate.services import storage
+
+# the tables as the first release created them (before text_preview,
+# created_at_iso and the list indexes)
+_OLD_SCHEMA = """
+CREATE TABLE recording (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    original_ext VARCHAR NOT NULL,
+    original_path VARCHAR NOT NULL,
+    duration_s FLOAT NOT NULL,
+    sha256 VARCHAR NOT NULL,
+    created_at DATETIME NOT NULL
+);
+CREATE INDEX ix_recording_id ON recording (id);
+CREATE TABLE transcript (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    recording_id VARCHAR NOT NULL REFERENCES recording (id),
+    text_path VARCHAR NOT NULL,
+    srt_path VARCHAR,
+    language VARCHAR,
+    language_probability FLOAT,
+    model VARCHAR NOT NULL,
+    device VARCHAR NOT NULL,
+    compute VARCHAR NOT NULL,
+    duration_s FLOAT,
+    created_at DATETIME NOT NULL,
+    title VARCHAR,
+    notes VARCHAR
+);
+CREATE INDEX ix_transcript_id ON transcript (id);
+CREATE INDEX ix_transcript_recording_id ON transcript (recording_id);
+"""
+
+
+@pytest.fixture
+def old_db(tmp_path, monkeypatch):
+    path = tmp_path / "old.db"
+    text_path = tmp_path / "transcript.txt"
+    storage.write_text(text_path, "first line\nsecond line")
+
+    con = sqlite3.connect(path)
+    con.executescript(_OLD_SCHEMA)
+    con.execute(
+        "INSERT INTO recording VALUES ('rec_old', '.wav', 'x.wav', 1.0, 'sha', '2024-01-02 03:04:05.000000')"
+    )
+    con.execute(
+        "INSERT INTO transcript (id, recording_id, text_path, model, device, compute, created_at) "
+        "VALUES ('tr_old', 'rec_old', ?, 'small', 'cpu', 'int8', '2024-01-02 03:04:06.500000')",
+        (str(text_path),),
+    )
+    con.execute(
+        "INSERT INTO transcript (id, recording_id, text_path, model, device, compute, created_at) "
+        "VALUES ('tr_nofile', 'rec_old', ?, 'small', 'cpu', 'int8', '2024-01-02 03:04:07.000000')",
+        (str(tmp_path / "missing.txt"),),
+    )
+    con.commit()
+    con.close()
+
+    engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setattr(db_session, "engine", engine)
+    yield path
+    engine.dispose()
+
+
+def _indexes(con, table):
+    return {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=?", (table,))}
+
+
+def test_init_db_upgrades_old_schema(old_db):
+    db_session.init_db()
+    db_session.init_db()  # and is idempotent
+
+    con = sqlite3.connect(old_db)
+    cols = {r[1] for r in con.execute("PRAGMA table_info(transcript)")}
+    assert {"text_preview", "created_at_iso"} <= cols
+
+    rows = dict(con.execute("SELECT id, text_preview FROM transcript"))
+    assert rows == {"tr_old": "first line second line", "tr_nofile": ""}
+
+    assert con.execute("SELECT created_at_iso FROM transcript WHERE id = 'tr_old'").fetchone()[0] == (
+        "2024-01-02T03:04:06.500000+00:00"
+    )
+    assert con.execute("SELECT created_at_iso FROM recording").fetchone()[0] == "2024-01-02T03:04:05+00:00"
+
+    idx = _indexes(con, "transcript")
+    assert {"ix_transcript_created_at_desc", "ix_transcript_rec_created"} <= idx
+    assert "ix_transcript_recording_id" not in idx
+    assert "ix_recording_created_at_desc" in _indexes(con, "recording")
+    con.close()
@@ -0,0 +1,73 @@
+# tests/test_jobs_stream.py
+from __future__ import annotations
+import json
+import threading
+import time
+
+import pytest
+
+from orate.api import jobs as jobs_api
+from orate.db import crud
+from orate.db.models import JobStatus
+from orate.services import storage
+
+
+@pytest.fixture
+def job_id(client) -> str:
+    jid = storage.new_id("job")
+    crud.create_job(id=jid, kind="transcribe", payload_json="{}")
+    return jid
+
+
+def _read_stream(client, job_id, writer):
+    """
+    Lines of the SSE stream (blank separators dropped) until the server closes
+    it, while `writer` updates the job from another thread. (TestClient hands
+    over the body only once the stream ends, hence the thread.)
+    """
+    t = threading.Thread(target=writer)
+    t.start()
+    try:
+        with client.stream("GET", f"/api/jobs/{job_id}/stream") as r:
+            assert r.status_code == 200
+            assert r.headers["content-type"].startswith("text/event-stream")
+            lines = [line for line in r.iter_lines() if line]
+    finally:
+        t.join()
+    return lines
+
+
+def _events(lines):
+    return [json.loads(line[len("data: "):]) for line in lines if line.startswith("data: ")]
+
+
+def test_stream_sends_initial_state_updates_and_closes_when_done(client, job_id):
+    def _writer():
+        time.sleep(0.4)
+        crud.update_job_progress(job_id, progress=0.5, stage="decoding")
+        time.sleep(0.6)
+        crud.update_job_status(job_id, status=JobStatus.done, result_ref="tr_x")
+
+    events = _events(_read_stream(client, job_id, _writer))
+    assert events[0]["status"] == "queued"
+    assert {"status": "queued", "progress": 0.5, "stage": "decoding"}.items() <= events[1].items()
+    assert events[-1]["status"] == "done"
+    assert events[-1]["result_ref"] == "tr_x"
+
+
+def test_stream_sends_keep_alive_while_unchanged(client, job_id, monkeypatch):
+    monkeypatch.setattr(jobs_api, "STREAM_KEEPALIVE_S", 0.3)
+
+    def _writer():
+        time.sleep(1.0)
+        crud.update_job_status(job_id, status=JobStatus.error, error="boom")
+
+    lines = _read_stream(client, job_id, _writer)
+    assert ": keep-alive" in lines
+    events = _events(lines)
+    assert [e["status"] for e in events] == ["queued", "error"]
+    assert events[-1]["error"] == "boom"
+
+
+def test_stream_unknown_job(client):
+    assert client.get("/api/jobs/job_missing/stream").status_code == 404
@@ -0,0 +1,39 @@
+# tests/test_query_counts.py
+from __future__ import annotations
+
+from orate.db import crud
+from orate.services import storage
+
+
+def test_list_transcripts_queries(client, count_queries, transcript_id):
+    with count_queries() as q:
+        r = client.get("/api/transcripts?limit=50")
+    assert r.status_code == 200
+    assert len(r.json()["items"]) >= 3
+    assert len(q) <= 2
+
+
+def test_list_recordings_queries(client, count_queries, transcript_id):
+    with count_queries() as q:
+        r = client.get("/api/recordings")
+    assert r.status_code == 200
+    assert r.json()["items"]
+    assert len(q) <= 2
+
+
+def test_get_job_queries(client, count_queries):
+    job_id = storage.new_id("job")
+    crud.create_job(id=job_id, kind="transcribe", payload_json="{}")
+    with count_queries() as q:
+        r = client.get(f"/api/jobs/{job_id}")
+    assert r.status_code == 200
+    assert r.json()["job_id"] == job_id
+    assert len(q) == 1
+
+
+def test_get_transcript_queries(client, count_queries, transcript_id):
+    with count_queries() as q:
+        r = client.get(f"/api/transcripts/{transcript_id}")
+    assert r.status_code == 200
+    assert r.json()["text"] == "hello world"
+    assert len(q) == 1
@@ -0,0 +1,49 @@
+# tests/test_transcripts_api.py
+from __future__ import annotations
+import re
+
+import pytest
+
+from orate.api.transcripts import _safe_filename
+
+
+def _safe_filename_reference(title, fallback, ext):
+    """The regex-only version the translate() fast path must agree with."""
+    name = (title or "").strip()
+    name = re.sub(r"\s+", " ", name)
+    name = re.sub(r"[^A-Za-z0-9 _\.\-]+", "", name)
+    name = name.strip() or fallback
+    name = name[:60].replace(" ", "_")
+    return name + (ext if ext.startswith(".") else "." + ext)
+
+
+@pytest.mark.parametrize("title", [
+    None,
+    "",
+    "   ",
+    "Lecture 3",
+    "Lecture  3",
+    "tabs\tand\nnewlines",
+    "Ünïcödé title",
+    "a/b\\c:d*e?",
+    "!!!",
+    "x" * 100,
+    "  padded  ",
+    "dots.and-dashes_ok",
+])
+@pytest.mark.parametrize("ext", ["txt", ".srt"])
+def test_safe_filename_matches_reference(title, ext):
+    assert _safe_filename(title, "tr_x", ext) == _safe_filename_reference(title, "tr_x", ext)
+
+
+def test_safe_filename_examples():
+    assert _safe_filename("My Title  x", "tr_x", "txt") == "My_Title_x.txt"
+    assert _safe_filename("???", "tr_x", ".srt") == "tr_x.srt"
+
+
+def test_download_uses_title(client, transcript_id):
+    client.patch(f"/api/transcripts/{transcript_id}", json={"title": "Weekly sync"})
+    r = client.get(f"/api/transcripts/{transcript_id}/download?format=txt")
+    assert r.status_code == 200
+    assert r.text == "hello world"
+    assert r.headers["content-disposition"] == "attachment; filename*=UTF-8''Weekly_sync.txt"
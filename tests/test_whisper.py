@@ -0,0 +1,154 @@
+# tests/test_whisper.py
+from __future__ import annotations
+from types import SimpleNamespace
+import io
+import random
+
+import numpy as np
+import pytest
+
+from orate.services import whisper
+from orate.services.storage import text_preview
+
+
+def _assign_reference(seg_starts, seg_ends, diar_segments):
+    """The original O(n*m) loop: max overlap, ties to the earlier turn."""
+    mapping = {}
+    for i, (s0, s1) in enumerate(zip(seg_starts, seg_ends)):
+        best_spk, best_ov = None, 0.0
+        for d0, d1, spk in diar_segments:
+            ov = min(s1, d1) - max(s0, d0)
+            if ov > best_ov:
+                best_spk, best_ov = spk, ov
+        if best_spk is not None:
+            mapping[i] = best_spk
+    return mapping
+
+
+def test_assign_speakers_picks_max_overlap():
+    starts, ends = [0.0, 2.0, 5.0, 9.0], [2.0, 5.0, 6.0, 10.0]
+    diar = [(0.0, 3.0, "A"), (2.5, 6.0, "B")]
+    assert whisper._assign_speakers_to_segments(starts, ends, diar) == {0: "A", 1: "B", 2: "B"}
+
+
+def test_assign_speakers_ties_go_to_earlier_turn():
+    # both turns overlap the segment by 1 s; "B" is listed first
+    diar = [(1.0, 2.0, "B"), (0.0, 1.0, "A")]
+    assert whisper._assign_speakers_to_segments([0.0], [2.0], diar) == {0: "B"}
+
+
+def test_assign_speakers_empty():
+    assert whisper._assign_speakers_to_segments([], [], [(0.0, 1.0, "A")]) == {}
+    assert whisper._assign_speakers_to_segments([0.0], [1.0], []) == {}
+
+
+def test_assign_speakers_matches_reference_on_random_input():
+    rng = random.Random(0)
+    for _ in range(50):
+        diar = []
+        for _ in range(rng.randint(1, 30)):
+            s0 = rng.uniform(0, 100)
+            diar.append((s0, s0 + rng.uniform(0.1, 20), rng.choice("ABCD")))
+        starts = sorted(rng.uniform(0, 110) for _ in range(rng.randint(1, 40)))
+        ends = [s + rng.uniform(0.1, 8) for s in starts]
+        assert whisper._assign_speakers_to_segments(starts, ends, diar) == _assign_reference(starts, ends, diar)
+
+
+@pytest.mark.parametrize("pieces", [
+    ["hello", " world "],
+    ["  ", "\n", "  lead", "mid  ", "\n", "  "],
+    ["", "", ""],
+    [" a ", "\n", " ", "\n", "b\n\n"],
+])
+def test_stripped_writer_equals_join_strip(pieces):
+    buf = io.StringIO()
+    w = whisper._StrippedWriter(buf)
+    for p in pieces:
+        w.write(p)
+    expected = "".join(pieces).strip()
+    assert buf.getvalue() == expected
+    assert w.head == expected[: len(w.head)]
+
+
+@pytest.mark.parametrize("ts,expected", [
+    (0.0, "00:00:00,000"),
+    (1.14, "00:00:01,140"),  # 1.14 * 1000 == 1139.999...
+    (59.9995, "00:01:00,000"),
+    (3723.042, "01:02:03,042"),
+])
+def test_srt_ts(ts, expected):
+    assert whisper._srt_ts(ts) == expected
+
+
+class _FakeModel:
+    model = SimpleNamespace(compute_type="int8")
+
+    def __init__(self, segments):
+        self._segments = segments
+
+    def transcribe(self, audio, **kwargs):
+        info = SimpleNamespace(language="en", language_probability=0.9, duration=20.0, duration_after_vad=18.0)
+        return iter(self._segments), info
+
+
+def _seg(start, end, text):
+    return SimpleNamespace(start=start, end=end, text=text)
+
+
+SEGMENTS = [
+    _seg(0.0, 1.14, "  "),
+    _seg(1.14, 2.0, " Hello there. "),
+    _seg(2.0, 3.0, ""),
+    _seg(3.0, 4.5, " World "),
+    _seg(4.5, 5.0, " again"),
+]
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(whisper, "load_model", lambda o: _FakeModel(SEGMENTS))
+    monkeypatch.setattr(whisper, "_load_audio", lambda p, c=None: np.zeros(16000, dtype=np.float32))
+    monkeypatch.setattr(whisper, "_warm_vad", lambda: None)
+
+
+@pytest.mark.parametrize("keep_text", [True, False])
+def test_transcribe_audio_streams_txt_and_srt(tmp_path, fake_model, keep_text):
+    progress = []
+    result = whisper.transcribe_audio(
+        tmp_path / "in.wav",
+        tmp_path / "transcript",
+        whisper.TranscribeOpts(batch_size=1),
+        write_srt=True,
+        progress_cb=progress.append,
+        keep_text=keep_text,
+        precomputed_sha="x",
+    )
+
+    txt = (tmp_path / "transcript.txt").read_text(encoding="utf-8")
+    srt = (tmp_path / "transcript.srt").read_text(encoding="utf-8")
+    assert txt == "Hello there.\nWorld\nagain"
+    # empty segments are skipped and cues are numbered by what's emitted
+    assert srt == (
+        "1\n00:00:01,140 --> 00:00:02,000\nHello there.\n\n"
+        "2\n00:00:03,000 --> 00:00:04,500\nWorld\n\n"
+        "3\n00:00:04,500 --> 00:00:05,000\nagain"
+    )
+    assert result.preview == text_preview(txt)
+    assert (result.text, result.srt) == ((txt, srt) if keep_text else (None, None))
+    assert result.sha256 == "x"
+    assert result.language == "en"
+    assert result.compute == "int8"
+    # the reporter drains to the newest value; the last one always arrives
+    assert progress and progress[-1] == 5.0
+
+
+def test_transcribe_audio_prefixes_speakers(tmp_path, fake_model, monkeypatch):
+    monkeypatch.setattr(whisper, "_try_diarize", lambda p, a=None: [(0.0, 2.5, "S1"), (2.5, 6.0, "S2")])
+    whisper.transcribe_audio(
+        tmp_path / "in.wav",
+        tmp_path / "transcript",
+        whisper.TranscribeOpts(batch_size=1, diarize=True),
+        precomputed_sha="x",
+    )
+    txt = (tmp_path / "transcript.txt").read_text(encoding="utf-8")
+    assert txt == "S1: Hello there.\nS2: World\nS2: again"